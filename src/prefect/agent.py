@@ -2,12 +2,28 @@
 The agent is responsible for checking for flow runs that are ready to run and starting
 their execution.
 """
-from typing import Iterator, List, Optional, Set
+import asyncio
+import copy
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 from uuid import UUID
 
 import anyio
 import anyio.to_process
+import anyio.to_thread
 import pendulum
+import pydantic
 from anyio.abc import TaskGroup
 
 from prefect.blocks.core import Block
@@ -18,8 +34,53 @@ from prefect.infrastructure.submission import submit_flow_run
 from prefect.logging import get_logger
 from prefect.orion.schemas.core import BlockDocument, FlowRun, WorkQueue
 from prefect.orion.schemas.data import DataDocument
-from prefect.orion.schemas.states import Failed, Pending
-from prefect.settings import PREFECT_AGENT_PREFETCH_SECONDS
+from prefect.orion.schemas.states import Failed, Pending, State
+from prefect.settings import (
+    PREFECT_AGENT_PREFETCH_SECONDS,
+    PREFECT_AGENT_RUN_CACHE_MODE,
+)
+
+# Queues whose change tokens have not moved are not polled for runs, but every
+# queue is fully polled at least this often as a safety fallback.
+QUEUE_FULL_POLL_SECONDS = 3600
+
+# How long a cached work queue object is served before it is re-read, how
+# long an expired entry may linger before it is swept from the cache, and the
+# maximum number of entries kept before the least recently used is evicted.
+WORK_QUEUE_CACHE_TTL_SECONDS = 30
+WORK_QUEUE_CACHE_SWEEP_SECONDS = 300
+MAX_CACHED_QUEUES = 1000
+
+# The run cache looks at least this far ahead when prefetching upcoming runs
+# and is refreshed in the background at this interval.
+RUN_CACHE_LOOKAHEAD_SECONDS = 300
+RUN_CACHE_REFRESH_SECONDS = 30
+
+# The maximum number of infrastructure block documents cached per agent, and
+# how long an entry is served before the document is re-read. The TTL bounds
+# how long an in-place edit to a block document can go unnoticed.
+INFRA_CACHE_MAX_SIZE = 128
+INFRA_CACHE_TTL_SECONDS = 30
+
+# How long state proposals are collected before they are flushed to the server
+# in a single batched request.
+STATE_PROPOSAL_BATCH_WINDOW_SECONDS = 0.01
+
+# Ready runs are buffered and dispatched together as soon as this many have
+# accumulated or this much time has passed since the first run was buffered,
+# trading a small bounded latency for per-batch amortization of the state
+# proposals and infrastructure reads.
+SUBMISSION_MAX_BATCH = 25
+SUBMISSION_MAX_LATENCY_SECONDS = 0.05
+
+
+@dataclass
+class _WorkQueueCacheEntry:
+    """A cached work queue with its expiration and last access time."""
+
+    work_queue: WorkQueue
+    expires_at: datetime
+    last_hit: datetime
 
 
 class OrionAgent:
@@ -36,16 +97,59 @@ class OrionAgent:
                 "Provide only one of 'default_infrastructure' and 'default_infrastructure_document_id'."
             )
 
-        self.work_queues: Set[str] = set(work_queues)
+        # the set of queue names is fixed for the life of the agent; freezing
+        # it guards against accidental mutation and the sorted tuple gives
+        # batched reads a deterministic order
+        self.work_queues: FrozenSet[str] = frozenset(work_queues)
+        self._work_queues_sorted: Tuple[str, ...] = tuple(sorted(self.work_queues))
         self.prefetch_seconds = prefetch_seconds
-        self.submitting_flow_run_ids = set()
+        self.submitting_flow_run_ids: Dict[UUID, FlowRun] = {}
         self.started = False
         self.logger = get_logger("agent")
         self.task_group: Optional[TaskGroup] = None
         self.client: Optional[OrionClient] = None
 
-        self._work_queue_cache_expiration: pendulum.DateTime = None
-        self._work_queue_cache: List[WorkQueue] = []
+        self._work_queue_cache: Dict[str, _WorkQueueCacheEntry] = {}
+        # per-name locks make concurrent refreshes of the same queue
+        # single-flight: the first coroutine re-reads and the rest wait for
+        # its result instead of issuing duplicate requests
+        self._work_queue_locks: DefaultDict[str, asyncio.Lock] = defaultdict(
+            asyncio.Lock
+        )
+        self._work_queue_run_tokens: Dict[UUID, str] = {}
+        self._work_queue_last_polled: Dict[UUID, datetime] = {}
+
+        self._run_cache_mode: str = PREFECT_AGENT_RUN_CACHE_MODE.value()
+        self._run_cache: Dict[UUID, List[FlowRun]] = {}
+        self._run_cache_upper: Optional[datetime] = None
+        self._run_cache_scope: Optional[anyio.CancelScope] = None
+        self._work_queue_refresh_scope: Optional[anyio.CancelScope] = None
+
+        # state proposals queued for the next batched `propose_states` call,
+        # keyed by flow run id; each future resolves with the proposal's result
+        self._state_proposals: Dict[UUID, Tuple[State, asyncio.Future]] = {}
+        self._state_proposal_flush_scheduled = False
+
+        # ready runs buffered for the next dispatched submission batch; the
+        # event is set when the buffer reaches SUBMISSION_MAX_BATCH so the
+        # dispatcher does not wait out the full latency window. The event is
+        # created in `start` because on Python < 3.10 `asyncio.Event()` binds
+        # the event loop it is constructed under, which may differ from the
+        # loop the agent runs in
+        self._submission_buffer: List[FlowRun] = []
+        self._submission_batch_full: Optional[asyncio.Event] = None
+        self._submission_dispatch_scheduled = False
+
+        # infrastructure block documents rarely change; they are cached with
+        # the deployment's update time in the key so deployment edits are
+        # picked up immediately, and entries expire after a short TTL so an
+        # in-place edit to the block document itself is picked up within
+        # INFRA_CACHE_TTL_SECONDS. The deployment's overrides are parsed once
+        # and cached alongside the document as pre-tokenized (path, value)
+        # pairs
+        self._infra_document_cache: "OrderedDict[Tuple[UUID, UUID, pendulum.DateTime], Tuple[BlockDocument, List[Tuple[Tuple[str, ...], Any]], datetime]]" = (
+            OrderedDict()
+        )
 
         if default_infrastructure:
             self.default_infrastructure_document_id = (
@@ -63,40 +167,215 @@ class OrionAgent:
         """
         Loads the work queue objects corresponding to the agent's target work
         queues. If any of them don't exist, they are created.
+
+        Each cache entry carries its own expiration, so only the entries that
+        have actually expired are re-read; the rest are served from the cache.
         """
 
-        # if the queue cache has not expired, yield queues from the cache
-        now = pendulum.now("UTC")
-        if (self._work_queue_cache_expiration or now) > now:
-            for queue in self._work_queue_cache:
-                yield queue
+        now = datetime.now(timezone.utc)
+
+        # drop entries that have been expired for a while to bound the cache
+        for name, entry in list(self._work_queue_cache.items()):
+            if entry.expires_at < now - timedelta(
+                seconds=WORK_QUEUE_CACHE_SWEEP_SECONDS
+            ):
+                del self._work_queue_cache[name]
+
+        # refresh only the entries that are missing or expired, concurrently
+        misses = [
+            name
+            for name in self._work_queues_sorted
+            if name not in self._work_queue_cache
+            or self._work_queue_cache[name].expires_at <= now
+        ]
+        if misses:
+            await asyncio.gather(
+                *(self._get_or_refresh_work_queue(name, now) for name in misses)
+            )
+
+        for name in self._work_queues_sorted:
+            entry = self._work_queue_cache.get(name)
+            if entry is not None:
+                entry.last_hit = now
+                yield entry.work_queue
+
+    async def _refresh_work_queues_loop(self, task_status) -> None:
+        """
+        Periodically re-read work queues that are about to expire so the
+        request path always finds a warm cache instead of blocking on a
+        reload when the TTL lapses.
+        """
+        with anyio.CancelScope() as scope:
+            task_status.started(scope)
+            while True:
+                await anyio.sleep(WORK_QUEUE_CACHE_TTL_SECONDS * 2 / 3)
+                try:
+                    await self._refresh_work_queues()
+                except Exception:
+                    self.logger.exception("Failed to refresh work queues.")
+
+    async def _refresh_work_queues(self) -> None:
+        """
+        Re-read any work queues that are missing from the cache or will
+        expire before the refresher's next pass.
+        """
+        now = datetime.now(timezone.utc)
+        horizon = now + timedelta(seconds=WORK_QUEUE_CACHE_TTL_SECONDS / 3)
+        stale = [
+            name
+            for name in self._work_queues_sorted
+            if name not in self._work_queue_cache
+            or self._work_queue_cache[name].expires_at <= horizon
+        ]
+        if not stale:
             return
 
-        # otherwise clear the cache, set the expiration for 30 seconds, and
-        # reload the work queues
-        self._work_queue_cache.clear()
-        self._work_queue_cache_expiration = now.add(seconds=30)
+        await asyncio.gather(
+            *(self._get_or_refresh_work_queue(name, horizon) for name in stale)
+        )
+
+    async def _get_or_refresh_work_queue(
+        self, name: str, horizon: datetime
+    ) -> Optional[WorkQueue]:
+        """
+        Serve the named work queue from the cache, re-reading it if its entry
+        is missing or expires before the given horizon.
 
-        for name in self.work_queues:
+        The refresh is guarded by a per-name lock so concurrent callers (e.g.
+        a poll racing the background refresher) coalesce into a single
+        request rather than stampeding the API.
+        """
+        async with self._work_queue_locks[name]:
+            entry = self._work_queue_cache.get(name)
+            if entry is not None and entry.expires_at > horizon:
+                entry.last_hit = datetime.now(timezone.utc)
+                return entry.work_queue
+
+            work_queue = await self._load_work_queue(name)
+            if work_queue is not None:
+                now = datetime.now(timezone.utc)
+                self._work_queue_cache[name] = _WorkQueueCacheEntry(
+                    work_queue=work_queue,
+                    expires_at=now + timedelta(seconds=WORK_QUEUE_CACHE_TTL_SECONDS),
+                    last_hit=now,
+                )
+
+                # past the cap, evict the least recently used entry
+                while len(self._work_queue_cache) > MAX_CACHED_QUEUES:
+                    coldest = min(
+                        self._work_queue_cache,
+                        key=lambda key: self._work_queue_cache[key].last_hit,
+                    )
+                    del self._work_queue_cache[coldest]
+            return work_queue
+
+    async def _load_work_queue(self, name: str) -> Optional[WorkQueue]:
+        """
+        Read a work queue by name, creating it if it does not exist.
+        """
+        try:
+            return await self.client.read_work_queue_by_name(name)
+        except ObjectNotFound:
+
+            # if the work queue wasn't found, create it
             try:
-                work_queue = await self.client.read_work_queue_by_name(name)
-            except ObjectNotFound:
+                work_queue = await self.client.create_work_queue(name=name)
+                self.logger.info(f"Created work queue '{name}'.")
+                return work_queue
+
+            # if creating it raises an exception, it was probably just
+            # created by some other agent; rather than entering a re-read
+            # loop with new error handling, we log the exception and
+            # continue.
+            except Exception as exc:
+                self.logger.exception(f"Failed to create work queue {name!r}.")
+                return None
 
-                # if the work queue wasn't found, create it
+    async def _prefetch_runs_loop(self, task_status) -> None:
+        """
+        Periodically refresh the prefetch cache of upcoming flow runs so that
+        polls can be served from memory instead of querying the work queues.
+        """
+        with anyio.CancelScope() as scope:
+            task_status.started(scope)
+            while True:
                 try:
-                    work_queue = await self.client.create_work_queue(name=name)
-                    self.logger.info(f"Created work queue '{name}'.")
-
-                # if creating it raises an exception, it was probably just
-                # created by some other agent; rather than entering a re-read
-                # loop with new error handling, we log the exception and
-                # continue.
-                except Exception as exc:
-                    self.logger.exception(f"Failed to create work queue {name!r}.")
-                    continue
+                    await self._refresh_run_cache()
+                except Exception:
+                    self.logger.exception("Failed to refresh the flow run cache.")
+                await anyio.sleep(RUN_CACHE_REFRESH_SECONDS)
 
-            self._work_queue_cache.append(work_queue)
-            yield work_queue
+    async def _refresh_run_cache(self) -> None:
+        """
+        Read all upcoming runs in the cache's look-ahead window and store them
+        per queue, replacing the previous cache contents atomically.
+        """
+        queues = [
+            work_queue
+            async for work_queue in self.get_work_queues()
+            if not work_queue.is_paused
+        ]
+        upper = datetime.now(timezone.utc) + timedelta(
+            seconds=max(
+                self.prefetch_seconds or PREFECT_AGENT_PREFETCH_SECONDS.value(),
+                RUN_CACHE_LOOKAHEAD_SECONDS,
+            )
+        )
+        run_cache = {}
+        if queues:
+            run_cache = await self.client.get_runs_in_work_queues(
+                ids=[work_queue.id for work_queue in queues],
+                limit_per_queue=10,
+                scheduled_before=upper,
+            )
+
+        self._run_cache = run_cache
+        self._run_cache_upper = upper
+
+    def _run_cache_covers(self, before: datetime) -> bool:
+        """
+        Whether the cache's look-ahead window covers runs scheduled before the
+        given time; if not, callers must fall back to a live query.
+        """
+        return self._run_cache_upper is not None and before <= self._run_cache_upper
+
+    def _run_cache_serviceable(self) -> bool:
+        """
+        Whether polls may be served from the cache at all: only when every
+        watched work queue is cached and none of them enforces a concurrency
+        limit, since `get_runs_in_work_queue` applies the limit server-side
+        and cached runs would bypass it.
+        """
+        for name in self._work_queues_sorted:
+            entry = self._work_queue_cache.get(name)
+            if entry is None or entry.work_queue.concurrency_limit is not None:
+                return False
+        return True
+
+    def _get_cached_runs(
+        self, before: datetime, consume: bool
+    ) -> List[FlowRun]:
+        """
+        Read runs scheduled before the given time from the prefetch cache.
+
+        If `consume` is true, the returned runs are removed from the cache so
+        they are not returned again before the next refresh.
+        """
+        cached_runs = []
+        for work_queue_id, runs in self._run_cache.items():
+            served = [
+                run
+                for run in runs
+                if run.next_scheduled_start_time is None
+                or run.next_scheduled_start_time <= before
+            ]
+            cached_runs.extend(served)
+            if consume and served:
+                served_ids = {run.id for run in served}
+                self._run_cache[work_queue_id] = [
+                    run for run in runs if run.id not in served_ids
+                ]
+        return cached_runs
 
     async def get_and_submit_flow_runs(self) -> List[FlowRun]:
         """
@@ -108,48 +387,205 @@ class OrionAgent:
 
         self.logger.debug("Checking for flow runs...")
 
-        before = pendulum.now("utc").add(
+        now = datetime.now(timezone.utc)
+        before = now + timedelta(
             seconds=self.prefetch_seconds or PREFECT_AGENT_PREFETCH_SECONDS.value()
         )
 
+        # if the prefetch cache covers the current window, serve the poll from
+        # memory and skip the queue queries entirely; queues with a
+        # concurrency limit cannot be served from the cache because cached
+        # runs bypass the server-side concurrency gate
+        if (
+            self._run_cache_mode == "enabled"
+            and self._run_cache_covers(before)
+            and self._run_cache_serviceable()
+        ):
+            submittable_runs = self._get_cached_runs(before, consume=True)
+            await self._submit_scheduled_flow_runs(submittable_runs)
+            return submittable_runs
+
         submittable_runs = []
 
-        # load runs from each work queue
+        # collect the work queues to poll, printing a nice message for any that
+        # are paused
+        queues = []
         async for work_queue in self.get_work_queues():
-
-            # print a nice message if the work queue is paused
             if work_queue.is_paused:
                 self.logger.info(
                     f"Work queue {work_queue.name!r} ({work_queue.id}) is paused."
                 )
+            else:
+                queues.append(work_queue)
+
+        # read a cheap change token for each queue; queues whose token has not
+        # moved since their last successful poll have no new work and can be
+        # skipped entirely, subject to an hourly full poll as a safety net
+        tokens = None
+        if queues:
+            try:
+                tokens = await self.client.read_work_queue_tokens(
+                    ids=[work_queue.id for work_queue in queues],
+                    scheduled_before=before,
+                )
+            except Exception:
+                # if tokens cannot be read, fail open and poll every queue
+                self.logger.debug(
+                    "Failed to read work queue tokens; polling all queues.",
+                    exc_info=True,
+                )
 
+        if tokens is not None:
+            queues = [
+                work_queue
+                for work_queue in queues
+                if tokens.get(work_queue.id)
+                != self._work_queue_run_tokens.get(work_queue.id)
+                or work_queue.id not in self._work_queue_last_polled
+                or (now - self._work_queue_last_polled[work_queue.id]).total_seconds()
+                > QUEUE_FULL_POLL_SECONDS
+            ]
+
+        # read runs from all of the queues with a single request so a poll tick
+        # costs one round-trip regardless of how many queues the agent watches
+        if queues:
+            try:
+                runs_by_queue = await self.client.get_runs_in_work_queues(
+                    ids=[work_queue.id for work_queue in queues],
+                    limit_per_queue=10,
+                    scheduled_before=before,
+                )
+            except Exception as exc:
+                self.logger.exception(exc)
             else:
-                try:
-                    queue_runs = await self.client.get_runs_in_work_queue(
-                        id=work_queue.id, limit=10, scheduled_before=before
-                    )
-                    submittable_runs.extend(queue_runs)
-                except ObjectNotFound:
-                    self.logger.error(
-                        f"Work queue {work_queue.name!r} ({work_queue.id}) not found."
-                    )
-                except Exception as exc:
-                    self.logger.exception(exc)
+                for work_queue in queues:
+                    if work_queue.id in runs_by_queue:
+                        submittable_runs.extend(runs_by_queue[work_queue.id])
+                        if tokens is not None:
+                            self._work_queue_run_tokens[work_queue.id] = tokens.get(
+                                work_queue.id
+                            )
+                        self._work_queue_last_polled[work_queue.id] = now
+                    else:
+                        # deleted queues are omitted from the batch response
+                        self.logger.error(
+                            f"Work queue {work_queue.name!r} ({work_queue.id}) not found."
+                        )
+
+        # in shadow mode, compare the cache against the live results so the
+        # cache can be validated before it is enabled
+        if self._run_cache_mode == "shadow" and self._run_cache_covers(before):
+            # runs the agent is submitting leave the live results immediately
+            # but may linger in the cache until the next refresh; exclude them
+            # so validation does not flag the agent's own submissions
+            in_flight = set(self.submitting_flow_run_ids)
+            cached_ids = {
+                run.id for run in self._get_cached_runs(before, consume=False)
+            } - in_flight
+            live_ids = {run.id for run in submittable_runs} - in_flight
+            if cached_ids != live_ids:
+                self.logger.warning(
+                    "Run cache mismatch: cached runs %s do not match polled runs %s",
+                    sorted(cached_ids),
+                    sorted(live_ids),
+                )
+
+        await self._submit_scheduled_flow_runs(submittable_runs)
+
+        return submittable_runs
+
+    async def _submit_scheduled_flow_runs(self, submittable_runs: List[FlowRun]) -> None:
+        """
+        Submit runs for execution, skipping any that are already being
+        submitted.
 
+        Rejections that can be decided without I/O are handled eagerly and
+        inline, so no task is created for runs that cannot be submitted; a
+        task is only spawned once real work remains.
+        """
+        ready_runs = []
         for flow_run in submittable_runs:
-            self.logger.info(f"Submitting flow run '{flow_run.id}'")
 
             # don't resubmit a run
             if flow_run.id in self.submitting_flow_run_ids:
                 continue
 
-            self.submitting_flow_run_ids.add(flow_run.id)
-            self.task_group.start_soon(
-                self.submit_run,
-                flow_run,
-            )
+            # prefetched runs may have been moved out of a scheduled state
+            # since they were cached
+            if flow_run.state and not flow_run.state.is_scheduled():
+                self.logger.info(
+                    f"Aborted submission of flow run '{flow_run.id}': "
+                    "Flow run is no longer scheduled."
+                )
+                continue
 
-        return submittable_runs
+            self.logger.info(f"Submitting flow run '{flow_run.id}'")
+            self.submitting_flow_run_ids[flow_run.id] = flow_run
+            ready_runs.append(flow_run)
+
+        if not ready_runs:
+            return
+
+        # drop the runs from the prefetch cache so they are neither served
+        # nor reported as mismatches again before the next refresh
+        if self._run_cache:
+            ready_ids = {flow_run.id for flow_run in ready_runs}
+            for work_queue_id, runs in self._run_cache.items():
+                self._run_cache[work_queue_id] = [
+                    run for run in runs if run.id not in ready_ids
+                ]
+
+        # buffer the runs and let the dispatcher submit the batch once the
+        # buffer fills or the latency window elapses, so runs arriving close
+        # together share one dispatch
+        self._submission_buffer.extend(ready_runs)
+        if len(self._submission_buffer) >= SUBMISSION_MAX_BATCH:
+            self._submission_batch_full.set()
+        if not self._submission_dispatch_scheduled:
+            self._submission_dispatch_scheduled = True
+            self.task_group.start_soon(self._dispatch_submission_batch)
+
+    async def _dispatch_submission_batch(self) -> None:
+        """
+        Wait until the submission buffer fills or the latency window since the
+        first buffered run elapses, then submit everything collected.
+        """
+        with anyio.move_on_after(SUBMISSION_MAX_LATENCY_SECONDS):
+            await self._submission_batch_full.wait()
+
+        self._submission_dispatch_scheduled = False
+        self._submission_batch_full.clear()
+        ready_runs, self._submission_buffer = self._submission_buffer, []
+        if not ready_runs:
+            return
+
+        # read every run's deployment and infrastructure up front and in
+        # parallel so the submissions do not serialize on these reads after
+        # their state proposals resolve; failures fall back to the read in
+        # `submit_run` so its error handling is unchanged
+        prefetched = await asyncio.gather(
+            *(self.get_infrastructure(flow_run) for flow_run in ready_runs),
+            return_exceptions=True,
+        )
+        infrastructures = {
+            flow_run.id: infrastructure
+            for flow_run, infrastructure in zip(ready_runs, prefetched)
+            if not isinstance(infrastructure, BaseException)
+        }
+
+        # with a single run there is nothing to parallelize; awaiting it
+        # inline skips the task allocation and scheduler bookkeeping
+        if len(ready_runs) == 1:
+            await self.submit_run(
+                ready_runs[0], infrastructures.get(ready_runs[0].id)
+            )
+        else:
+            for flow_run in ready_runs:
+                self.task_group.start_soon(
+                    self.submit_run,
+                    flow_run,
+                    infrastructures.get(flow_run.id),
+                )
 
     async def get_infrastructure(self, flow_run: FlowRun) -> Infrastructure:
         deployment = await self.client.read_deployment(flow_run.deployment_id)
@@ -159,58 +595,190 @@ class OrionAgent:
             deployment.infrastructure_document_id
             or self.default_infrastructure_document_id
         )
-        infra_document = await self.client.read_block_document(
-            infrastructure_document_id
+
+        # the deployment's update time is part of the cache key, so deployment
+        # edits invalidate immediately; an in-place edit to the block document
+        # itself does not change the key and is only picked up when the
+        # entry's TTL lapses
+        now = datetime.now(timezone.utc)
+        cache_key = (deployment.id, infrastructure_document_id, deployment.updated)
+        cached = self._infra_document_cache.get(cache_key)
+        if cached is not None and now - cached[2] < timedelta(
+            seconds=INFRA_CACHE_TTL_SECONDS
+        ):
+            self._infra_document_cache.move_to_end(cache_key)
+            infra_document, parsed_overrides, _ = cached
+        else:
+            infra_document = await self.client.read_block_document(
+                infrastructure_document_id
+            )
+
+            # tokenize the dotted override paths once so repeat submissions
+            # do not re-split the same strings
+            parsed_overrides = [
+                (tuple(override.split(".")), value)
+                for override, value in (deployment.infra_overrides or {}).items()
+            ]
+
+            self._infra_document_cache[cache_key] = (
+                infra_document,
+                parsed_overrides,
+                now,
+            )
+            self._infra_document_cache.move_to_end(cache_key)
+            while len(self._infra_document_cache) > INFRA_CACHE_MAX_SIZE:
+                self._infra_document_cache.popitem(last=False)
+
+        # constructing the block is pure CPU work over a potentially large
+        # document; run it in a worker thread so the event loop stays free for
+        # other in-flight submissions and polls
+        infrastructure_block = await anyio.to_thread.run_sync(
+            Block._from_block_document, infra_document
         )
 
         # this piece of logic applies any overrides that may have been set on the deployment;
         # overrides are defined as dot.delimited paths on possibly nested attributes of the
-        # infrastructure block
-        doc_dict = infra_document.dict()
-        infra_dict = doc_dict.get("data", {})
-        for override, value in (deployment.infra_overrides or {}).items():
-            nested_fields = override.split(".")
-            data = infra_dict
-            for field in nested_fields[:-1]:
-                data = data[field]
-
-            # once we reach the end, set the value
-            data[nested_fields[-1]] = value
-
-        # reconstruct the infra block
-        doc_dict["data"] = infra_dict
-        infra_document = BlockDocument(**doc_dict)
-        infrastructure_block = Block._from_block_document(infra_document)
+        # infrastructure block. They are applied with `copy(update=...)`, which
+        # skips a second full validation pass over the block document
+        if parsed_overrides:
+            update = {}
+            for path, value in parsed_overrides:
+                field = path[0]
+
+                if len(path) == 1:
+                    update[field] = value
+                    continue
+
+                # nested overrides are merged into a copy of the field's
+                # current contents so the original block is not mutated
+                if field not in update:
+                    current = getattr(infrastructure_block, field)
+                    if isinstance(current, pydantic.BaseModel):
+                        current = current.dict()
+                    else:
+                        current = copy.deepcopy(current)
+                    update[field] = current
+
+                data = update[field]
+                for nested_field in path[1:-1]:
+                    data = data[nested_field]
+
+                # once we reach the end, set the value
+                data[path[-1]] = value
+
+            # `copy(update=...)` skips validation, so each overridden value is
+            # parsed against its field's declared type first. This preserves
+            # the coercion a full-document parse would perform (e.g. env
+            # values to `str`) and fails fast on invalid overrides instead of
+            # letting them propagate into the infrastructure
+            block_fields = type(infrastructure_block).__fields__
+            for field, value in update.items():
+                model_field = block_fields.get(field)
+                if model_field is not None:
+                    update[field] = pydantic.parse_obj_as(
+                        model_field.outer_type_, value
+                    )
+
+            infrastructure_block = infrastructure_block.copy(update=update)
+
         # TODO: Here the agent may update the infrastructure with agent-level settings
         return infrastructure_block
 
-    async def submit_run(self, flow_run: FlowRun) -> None:
+    async def submit_run(
+        self, flow_run: FlowRun, infrastructure: Infrastructure = None
+    ) -> None:
         """
         Submit a flow run to the flow runner
         """
+        try:
+            await self._submit_run_fast(flow_run, infrastructure)
+        except Exception as exc:
+            self.logger.error(
+                f"Flow runner failed to submit flow run '{flow_run.id}'",
+                exc_info=True,
+            )
+            await self._propose_failed_state(flow_run, exc)
+        finally:
+            # always release the run so an exception on any submission path
+            # cannot leave the id marked as in-flight forever
+            self.submitting_flow_run_ids.pop(flow_run.id, None)
+
+    async def _submit_run_fast(
+        self, flow_run: FlowRun, infrastructure: Optional[Infrastructure]
+    ) -> None:
+        """
+        The happy path of run submission, free of exception handling; failures
+        propagate to `submit_run`, which owns error reporting and cleanup.
+        """
         ready_to_submit = await self._propose_pending_state(flow_run)
 
         if ready_to_submit:
-            infrastructure = await self.get_infrastructure(flow_run)
+            if infrastructure is None:
+                infrastructure = await self.get_infrastructure(flow_run)
 
-            try:
-                # Wait for submission to be completed. Note that the submission function
-                # may continue to run in the background after this exits.
-                await self.task_group.start(submit_flow_run, flow_run, infrastructure)
-                self.logger.info(f"Completed submission of flow run '{flow_run.id}'")
-            except Exception as exc:
-                self.logger.error(
-                    f"Flow runner failed to submit flow run '{flow_run.id}'",
-                    exc_info=True,
-                )
-                await self._propose_failed_state(flow_run, exc)
+            # Wait for submission to be completed. Note that the submission function
+            # may continue to run in the background after this exits.
+            await self.task_group.start(submit_flow_run, flow_run, infrastructure)
+            self.logger.info(f"Completed submission of flow run '{flow_run.id}'")
+
+    async def _propose_state_batched(
+        self, flow_run_id: UUID, state: State
+    ) -> State:
+        """
+        Propose a state through the shared batching window.
+
+        Proposals registered while the window is open are flushed to the
+        server with a single `propose_states` call, so a tick that submits N
+        runs costs one state-change round-trip instead of N. The semantics of
+        the individual proposal are unchanged: the returned state is the
+        orchestrated result and an abort instruction raises `Abort`.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._state_proposals[flow_run_id] = (state, future)
+
+        if not self._state_proposal_flush_scheduled:
+            self._state_proposal_flush_scheduled = True
+            self.task_group.start_soon(self._flush_state_proposals)
+
+        return await future
 
-        self.submitting_flow_run_ids.remove(flow_run.id)
+    async def _flush_state_proposals(self) -> None:
+        """
+        Wait out the batching window, then resolve all queued proposals with
+        one `propose_states` call.
+        """
+        await anyio.sleep(STATE_PROPOSAL_BATCH_WINDOW_SECONDS)
+        self._state_proposal_flush_scheduled = False
+        proposals, self._state_proposals = self._state_proposals, {}
+        if not proposals:
+            return
+
+        try:
+            results = await self.client.propose_states(
+                {
+                    flow_run_id: state
+                    for flow_run_id, (state, _) in proposals.items()
+                }
+            )
+        except Exception as exc:
+            for _, future in proposals.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for flow_run_id, (_, future) in proposals.items():
+            if future.done():
+                continue
+            result = results.get(flow_run_id)
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
     async def _propose_pending_state(self, flow_run: FlowRun) -> bool:
         state = flow_run.state
         try:
-            state = await self.client.propose_state(Pending(), flow_run_id=flow_run.id)
+            state = await self._propose_state_batched(flow_run.id, Pending())
         except Abort as exc:
             self.logger.info(
                 f"Aborted submission of flow run '{flow_run.id}'. "
@@ -235,12 +803,14 @@ class OrionAgent:
 
     async def _propose_failed_state(self, flow_run: FlowRun, exc: Exception) -> None:
         try:
-            await self.client.propose_state(
-                Failed(
-                    message="Submission failed.",
-                    data=DataDocument.encode("cloudpickle", exc),
-                ),
-                flow_run_id=flow_run.id,
+            # pickling an arbitrary exception can be expensive; keep it off
+            # the event loop thread
+            data = await anyio.to_thread.run_sync(
+                lambda: DataDocument.encode("cloudpickle", exc)
+            )
+            await self._propose_state_batched(
+                flow_run.id,
+                Failed(message="Submission failed.", data=data),
             )
         except Abort:
             # We've already failed, no need to note the abort but we don't want it to
@@ -257,6 +827,7 @@ class OrionAgent:
     async def start(self):
         self.started = True
         self.task_group = anyio.create_task_group()
+        self._submission_batch_full = asyncio.Event()
         self.client = get_client()
         await self.client.__aenter__()
         await self.task_group.__aenter__()
@@ -267,15 +838,40 @@ class OrionAgent:
                 await self.default_infrastructure._save(is_anonymous=True)
             )
 
+        self._work_queue_refresh_scope = await self.task_group.start(
+            self._refresh_work_queues_loop
+        )
+
+        if self._run_cache_mode != "disabled":
+            self._run_cache_scope = await self.task_group.start(
+                self._prefetch_runs_loop
+            )
+
     async def shutdown(self, *exc_info):
         self.started = False
+        if self._run_cache_scope:
+            self._run_cache_scope.cancel()
+            self._run_cache_scope = None
+        if self._work_queue_refresh_scope:
+            self._work_queue_refresh_scope.cancel()
+            self._work_queue_refresh_scope = None
         await self.task_group.__aexit__(*exc_info)
         await self.client.__aexit__(*exc_info)
         self.task_group = None
         self.client = None
-        self.submitting_flow_run_ids = set()
-        self._work_queue_cache_expiration = None
-        self._work_queue_cache = []
+        self.submitting_flow_run_ids = {}
+        self._work_queue_cache = {}
+        self._work_queue_locks = defaultdict(asyncio.Lock)
+        self._work_queue_run_tokens = {}
+        self._work_queue_last_polled = {}
+        self._run_cache = {}
+        self._run_cache_upper = None
+        self._infra_document_cache = OrderedDict()
+        self._state_proposals = {}
+        self._state_proposal_flush_scheduled = False
+        self._submission_buffer = []
+        self._submission_batch_full = None
+        self._submission_dispatch_scheduled = False
 
     async def __aenter__(self):
         await self.start()
@@ -2,6 +2,7 @@
 Command line interface for working with flows.
 """
 
+from rich.live import Live
 from rich.table import Table
 
 from prefect.cli._types import PrefectTyper
@@ -20,22 +21,21 @@ async def ls(
     """
     View flows.
     """
-    async with get_client() as client:
-        flows = await client.read_flows(
-            limit=limit,
-            sort=FlowSort.CREATED_DESC,
-        )
-
     table = Table(title="Flows")
     table.add_column("ID", justify="right", style="cyan", no_wrap=True)
     table.add_column("Name", style="green", no_wrap=True)
     table.add_column("Created", no_wrap=True)
 
-    for flow in flows:
-        table.add_row(
-            str(flow.id),
-            str(flow.name),
-            str(flow.created),
-        )
-
-    app.console.print(table)
+    # rows are streamed into the table page by page so large listings start
+    # rendering before the full set has been read
+    with Live(table, console=app.console):
+        async with get_client() as client:
+            async for flow in client.iter_flows(
+                limit=limit,
+                sort=FlowSort.CREATED_DESC,
+            ):
+                table.add_row(
+                    str(flow.id),
+                    str(flow.name),
+                    str(flow.created),
+                )
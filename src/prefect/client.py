@@ -26,6 +26,7 @@ from functools import wraps
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
     ContextManager,
     Dict,
     Iterable,
@@ -492,6 +493,58 @@ class OrionClient:
         response = await self._client.post(f"/flows/filter", json=body)
         return pydantic.parse_obj_as(List[schemas.core.Flow], response.json())
 
+    async def iter_flows(
+        self,
+        *,
+        flow_filter: schemas.filters.FlowFilter = None,
+        flow_run_filter: schemas.filters.FlowRunFilter = None,
+        task_run_filter: schemas.filters.TaskRunFilter = None,
+        deployment_filter: schemas.filters.DeploymentFilter = None,
+        sort: schemas.sorting.FlowSort = None,
+        limit: int = None,
+        page_size: int = 50,
+    ) -> AsyncGenerator[schemas.core.Flow, None]:
+        """
+        Query Orion for flows as `read_flows` does, but read them one page at
+        a time and yield flows as the pages arrive, so callers can begin
+        consuming results before the full set has been transferred and parsed.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            sort: sort criteria for the flows
+            limit: the maximum number of flows to yield; `None` for all
+            page_size: the number of flows read per request
+
+        Yields:
+            [Flow model][prefect.orion.schemas.core.Flow] representations of
+                the flows
+        """
+        offset = 0
+        while limit is None or offset < limit:
+            page_limit = (
+                page_size if limit is None else min(page_size, limit - offset)
+            )
+            page = await self.read_flows(
+                flow_filter=flow_filter,
+                flow_run_filter=flow_run_filter,
+                task_run_filter=task_run_filter,
+                deployment_filter=deployment_filter,
+                sort=sort,
+                limit=page_limit,
+                offset=offset,
+            )
+            for flow in page:
+                yield flow
+
+            # a short page means the server has no more flows
+            if len(page) < page_limit:
+                return
+
+            offset += len(page)
+
     async def read_flow_by_name(
         self,
         flow_name: str,
@@ -923,6 +976,80 @@ class OrionClient:
                 raise
         return pydantic.parse_obj_as(List[schemas.core.FlowRun], response.json())
 
+    async def get_runs_in_work_queues(
+        self,
+        ids: List[UUID],
+        limit_per_queue: int = 10,
+        scheduled_before: datetime.datetime = None,
+    ) -> Dict[UUID, List[schemas.core.FlowRun]]:
+        """
+        Read flow runs off multiple work queues with a single request.
+
+        Args:
+            ids: the ids of the work queues to read from
+            limit_per_queue: a limit on the number of runs to return from each queue
+            scheduled_before: a timestamp; only runs scheduled before this time will be
+                returned. Defaults to now.
+
+        Raises:
+            httpx.RequestError: If request fails
+
+        Returns:
+            Dict[UUID, List[schemas.core.FlowRun]]: flow runs keyed by work queue
+                id. Work queues that do not exist are omitted from the result
+                instead of raising `ObjectNotFound`.
+        """
+        if scheduled_before is None:
+            scheduled_before = pendulum.now()
+
+        response = await self._client.post(
+            "/work_queues/get_runs",
+            json={
+                "work_queue_ids": [str(id) for id in ids],
+                "limit": limit_per_queue,
+                "scheduled_before": scheduled_before.isoformat(),
+            },
+        )
+        return pydantic.parse_obj_as(
+            Dict[UUID, List[schemas.core.FlowRun]], response.json()
+        )
+
+    async def read_work_queue_tokens(
+        self,
+        ids: List[UUID],
+        scheduled_before: datetime.datetime = None,
+    ) -> Dict[UUID, str]:
+        """
+        Read a change token for each of the given work queues.
+
+        A queue's token changes whenever a run is scheduled into (or leaves)
+        the window of runs the queue would serve, so callers can compare
+        tokens between polls and skip reading runs from unchanged queues.
+
+        Args:
+            ids: the ids of the work queues to read tokens for
+            scheduled_before: a timestamp; only runs scheduled before this time are
+                considered when computing tokens. Defaults to now.
+
+        Raises:
+            httpx.RequestError: If request fails
+
+        Returns:
+            Dict[UUID, str]: tokens keyed by work queue id. Work queues that
+                do not exist are omitted from the result.
+        """
+        if scheduled_before is None:
+            scheduled_before = pendulum.now()
+
+        response = await self._client.post(
+            "/work_queues/tokens",
+            json={
+                "work_queue_ids": [str(id) for id in ids],
+                "scheduled_before": scheduled_before.isoformat(),
+            },
+        )
+        return pydantic.parse_obj_as(Dict[UUID, str], response.json())
+
     async def read_work_queue(
         self,
         id: UUID,
@@ -1585,6 +1712,54 @@ class OrionClient:
         )
         return OrchestrationResult.parse_obj(response.json())
 
+    async def set_flow_run_states(
+        self,
+        states: Dict[UUID, schemas.states.State],
+        force: bool = False,
+    ) -> Dict[UUID, OrchestrationResult]:
+        """
+        Set the states of a batch of flow runs with a single request.
+
+        Args:
+            states: a map of flow run id to the state to set
+            force: if True, disregard orchestration logic when setting the states,
+                forcing the Orion API to accept the states
+
+        Returns:
+            a map of flow run id to an [OrchestrationResult model][prefect.orion.orchestration.rules.OrchestrationResult]
+                representation of state orchestration output; flow runs that do
+                not exist are omitted
+        """
+        states_json = {}
+        for flow_run_id, state in states.items():
+            state_data = schemas.actions.StateCreate(
+                type=state.type,
+                name=state.name,
+                message=state.message,
+                data=state.data,
+                state_details=state.state_details,
+            )
+            state_data.state_details.flow_run_id = flow_run_id
+
+            # Attempt to serialize the given data
+            try:
+                state_data_json = state_data.dict(json_compatible=True)
+            except TypeError:
+                # Drop the user data
+                state_data.data = None
+                state_data_json = state_data.dict(json_compatible=True)
+
+            states_json[str(flow_run_id)] = state_data_json
+
+        response = await self._client.post(
+            "/flow_runs/set_states",
+            json=dict(states=states_json, force=force),
+        )
+        return {
+            UUID(flow_run_id): OrchestrationResult.parse_obj(result)
+            for flow_run_id, result in response.json().items()
+        }
+
     async def read_flow_run_states(
         self, flow_run_id: UUID
     ) -> List[schemas.states.State]:
@@ -1817,6 +1992,85 @@ class OrionClient:
                 f"Received unexpected `SetStateStatus` from server: {response.status!r}"
             )
 
+    async def propose_states(
+        self,
+        states: Dict[UUID, schemas.states.State],
+    ) -> Dict[UUID, Union[schemas.states.State, BaseException]]:
+        """
+        Propose new states for a batch of flow runs with a single request,
+        invoking Orion orchestration logic for each run.
+
+        The semantics of each proposal match `propose_state`, but because the
+        batch is resolved as a whole, per-run failures are returned as values
+        instead of raised:
+
+        - an accepted proposal maps to the provided `state` augmented with
+          details
+        - a rejected proposal maps to the state returned by the Orion API
+        - a WAIT instruction causes the affected runs to be re-proposed
+          together after the longest requested delay
+        - an ABORT instruction maps to an `Abort` exception instance
+        - a flow run that does not exist maps to an `ObjectNotFound` exception
+          instance
+
+        Args:
+            states: a map of flow run id to the new state to propose
+
+        Returns:
+            a map of flow run id to a [State model][prefect.orion.schemas.states.State]
+                or, for runs that could not be transitioned, an exception
+                instance describing why
+        """
+        results: Dict[UUID, Union[schemas.states.State, BaseException]] = {}
+        pending = dict(states)
+
+        while pending:
+            responses = await self.set_flow_run_states(pending)
+
+            waiting = {}
+            delay_seconds = 0
+            for flow_run_id, state in pending.items():
+                response = responses.get(flow_run_id)
+
+                if response is None:
+                    results[flow_run_id] = prefect.exceptions.ObjectNotFound(
+                        http_exc=None
+                    )
+
+                elif response.status == schemas.responses.SetStateStatus.ACCEPT:
+                    # Update the state with the details if provided
+                    if response.state.state_details:
+                        state.state_details = response.state.state_details
+                    results[flow_run_id] = state
+
+                elif response.status == schemas.responses.SetStateStatus.ABORT:
+                    results[flow_run_id] = prefect.exceptions.Abort(
+                        response.details.reason
+                    )
+
+                elif response.status == schemas.responses.SetStateStatus.WAIT:
+                    self.logger.debug(
+                        f"Received wait instruction for {response.details.delay_seconds}s: "
+                        f"{response.details.reason}"
+                    )
+                    waiting[flow_run_id] = state
+                    delay_seconds = max(delay_seconds, response.details.delay_seconds)
+
+                elif response.status == schemas.responses.SetStateStatus.REJECT:
+                    results[flow_run_id] = response.state
+
+                else:
+                    results[flow_run_id] = ValueError(
+                        f"Received unexpected `SetStateStatus` from server: "
+                        f"{response.status!r}"
+                    )
+
+            pending = waiting
+            if pending:
+                await sleep(delay_seconds)
+
+        return results
+
     async def set_task_run_state(
         self,
         task_run_id: UUID,
@@ -1,5 +1,6 @@
 import copy
 import enum
+import re
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Union
 
@@ -25,6 +26,13 @@ if TYPE_CHECKING:
 else:
     kubernetes = lazy_import("kubernetes")
 
+# Precompiled patterns for the slugify calls below; `slugify` accepts a
+# compiled pattern, which avoids re-resolving the pattern string per call
+_SLUGIFY_NAME_PATTERN = re.compile(r"[^a-zA-Z0-9-]+")
+_SLUGIFY_LABEL_NAME_PATTERN = re.compile(r"[^a-zA-Z0-9-_.]+")
+_SLUGIFY_LABEL_PREFIX_PATTERN = re.compile(r"[^a-zA-Z0-9-\.]+")
+_SLUGIFY_LABEL_VALUE_PATTERN = re.compile(r"[^a-zA-Z0-9-_\.]+")
+
 
 class KubernetesImagePullPolicy(enum.Enum):
     IF_NOT_PRESENT = "IfNotPresent"
@@ -170,18 +178,24 @@ class KubernetesJob(Infrastructure):
     #   > implicit typing recommendations.
     #
     #   https://yaml.org/spec/1.2.2/#12-yaml-history
+    #
+    # The libyaml-backed CSafeLoader parses identically to SafeLoader but is an
+    # order of magnitude faster; fall back to SafeLoader where libyaml is not
+    # compiled in.
 
     @classmethod
     def job_from_file(cls, filename: str) -> KubernetesManifest:
         """Load a Kubernetes Job manifest from a YAML or JSON file."""
         with open(filename, "r", encoding="utf-8") as f:
-            return yaml.load(f, yaml.SafeLoader)
+            return yaml.load(f, getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
     @classmethod
     def customize_from_file(cls, filename: str) -> JsonPatch:
         """Load an RFC 6902 JSON patch from a YAML or JSON file."""
         with open(filename, "r", encoding="utf-8") as f:
-            return JsonPatch(yaml.load(f, yaml.SafeLoader))
+            return JsonPatch(
+                yaml.load(f, getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+            )
 
     async def run(
         self,
@@ -432,7 +446,7 @@ class KubernetesJob(Infrastructure):
         slug = slugify(
             name,
             max_length=45,  # Leave enough space for generateName
-            regex_pattern=r"[^a-zA-Z0-9-]+",
+            regex_pattern=_SLUGIFY_NAME_PATTERN,
         )
 
         # TODO: Handle the case that the name is an empty string after being
@@ -471,7 +485,7 @@ class KubernetesJob(Infrastructure):
             slugify(
                 name,
                 max_length=63,
-                regex_pattern=r"[^a-zA-Z0-9-_.]+",
+                regex_pattern=_SLUGIFY_LABEL_NAME_PATTERN,
             )
             or name
         )
@@ -483,7 +497,7 @@ class KubernetesJob(Infrastructure):
                 slugify(
                     prefix,
                     max_length=253,
-                    regex_pattern=r"[^a-zA-Z0-9-\.]+",
+                    regex_pattern=_SLUGIFY_LABEL_PREFIX_PATTERN,
                 )
                 or prefix
             )
@@ -513,7 +527,7 @@ class KubernetesJob(Infrastructure):
             slugify(
                 value,
                 max_length=63,
-                regex_pattern=r"[^a-zA-Z0-9-_\.]+",
+                regex_pattern=_SLUGIFY_LABEL_VALUE_PATTERN,
             )
             or value
         )
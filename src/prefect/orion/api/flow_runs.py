@@ -3,7 +3,7 @@ Routes for interacting with flow run objects.
 """
 
 import datetime
-from typing import List
+from typing import Dict, List
 from uuid import UUID
 
 import pendulum
@@ -15,6 +15,7 @@ import prefect.orion.models as models
 import prefect.orion.schemas as schemas
 from prefect.logging import get_logger
 from prefect.orion.api.run_history import run_history
+from prefect.orion.exceptions import ObjectNotFoundError
 from prefect.orion.models.flow_runs import DependencyResult
 from prefect.orion.orchestration import dependencies as orchestration_dependencies
 from prefect.orion.orchestration.policies import BaseOrchestrationPolicy
@@ -198,6 +199,45 @@ async def delete_flow_run(
         )
 
 
+@router.post("/set_states")
+async def set_flow_run_states(
+    states: Dict[UUID, schemas.actions.StateCreate] = Body(
+        ..., description="A map of flow run id to the intended state."
+    ),
+    force: bool = Body(
+        False,
+        description=(
+            "If false, orchestration rules will be applied that may alter "
+            "or prevent the state transition. If True, orchestration rules are not applied."
+        ),
+    ),
+    session: sa.orm.Session = Depends(dependencies.get_session),
+    flow_policy: BaseOrchestrationPolicy = Depends(
+        orchestration_dependencies.provide_flow_policy
+    ),
+) -> Dict[UUID, OrchestrationResult]:
+    """
+    Set states for a batch of flow runs with a single request, invoking any
+    orchestration rules for each run.
+
+    Flow runs that do not exist are omitted from the response.
+    """
+    results = {}
+    for flow_run_id, state in states.items():
+        try:
+            results[flow_run_id] = await models.flow_runs.set_flow_run_state(
+                session=session,
+                flow_run_id=flow_run_id,
+                # convert to a full State object
+                state=schemas.states.State.parse_obj(state),
+                force=force,
+                flow_policy=flow_policy,
+            )
+        except ObjectNotFoundError:
+            pass
+    return results
+
+
 @router.post("/{id}/set_state")
 async def set_flow_run_state(
     flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
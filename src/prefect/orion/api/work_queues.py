@@ -2,7 +2,7 @@
 Routes for interacting with work queue objects.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 import sqlalchemy as sa
@@ -129,6 +129,72 @@ async def read_work_queue_runs(
     return flow_runs
 
 
+@router.post("/get_runs")
+async def read_work_queues_runs(
+    work_queue_ids: List[UUID] = Body(
+        ..., description="The ids of the work queues to read runs from."
+    ),
+    limit: int = dependencies.LimitBody(),
+    scheduled_before: DateTimeTZ = Body(
+        None,
+        description="Only flow runs scheduled to start before this time will be returned.",
+    ),
+    agent_id: Optional[UUID] = Body(
+        None,
+        description="An optional unique identifier for the agent making this query. If provided, the Orion API will track the last time this agent polled the work queues.",
+    ),
+    session: sa.orm.Session = Depends(dependencies.get_session),
+) -> Dict[UUID, List[schemas.core.FlowRun]]:
+    """
+    Get flow runs from multiple work queues with a single request.
+
+    The `limit` applies to each queue individually. Work queues that do
+    not exist are omitted from the response rather than raising an error,
+    so callers can detect deleted queues by comparing the response keys
+    to the requested ids.
+    """
+    runs_by_queue = await models.work_queues.get_runs_in_work_queues(
+        session=session,
+        work_queue_ids=work_queue_ids,
+        scheduled_before=scheduled_before,
+        limit_per_queue=limit,
+    )
+
+    if agent_id:
+        for work_queue_id in runs_by_queue:
+            await models.agents.record_agent_poll(
+                session=session, agent_id=agent_id, work_queue_id=work_queue_id
+            )
+
+    return runs_by_queue
+
+
+@router.post("/tokens")
+async def read_work_queue_run_tokens(
+    work_queue_ids: List[UUID] = Body(
+        ..., description="The ids of the work queues to read tokens for."
+    ),
+    scheduled_before: DateTimeTZ = Body(
+        None,
+        description="Only runs scheduled to start before this time are considered when computing tokens.",
+    ),
+    session: sa.orm.Session = Depends(dependencies.get_session),
+) -> Dict[UUID, str]:
+    """
+    Get a change token for each work queue.
+
+    A queue's token changes whenever a run is scheduled into (or leaves)
+    the queue's polling window, so agents can skip reading runs from
+    queues whose tokens have not changed. Work queues that do not exist
+    are omitted from the response.
+    """
+    return await models.work_queues.read_work_queue_run_tokens(
+        session=session,
+        work_queue_ids=work_queue_ids,
+        scheduled_before=scheduled_before,
+    )
+
+
 @router.post("/filter")
 async def read_work_queues(
     limit: int = dependencies.LimitBody(),
@@ -4,6 +4,7 @@ Intended for internal use by the Orion API.
 """
 
 import datetime
+from typing import List
 from uuid import UUID
 
 import sqlalchemy as sa
@@ -170,6 +171,25 @@ async def delete_work_queue(
     return result.rowcount > 0
 
 
+def _flow_run_filter_for_work_queue(work_queue) -> dict:
+    """
+    Build the flow run filter criteria used to match runs to a work queue.
+    """
+    # handle legacy work queues that use tag-based filters
+    if work_queue.filter is not None:
+        # ensure the filter object is fully hydrated
+        # SQLAlchemy caching logic can result in a dict type instead
+        # of the full pydantic model
+        work_queue_filter = parse_obj_as(schemas.core.QueueFilter, work_queue.filter)
+        return dict(
+            tags=dict(all_=work_queue_filter.tags),
+            deployment_id=dict(any_=work_queue_filter.deployment_ids, is_null_=False),
+        )
+
+    # new work queues are entirely name-based
+    return dict(work_queue_name=dict(any_=[work_queue.name]))
+
+
 async def get_runs_in_work_queue(
     session: sa.orm.Session,
     work_queue_id: UUID,
@@ -197,20 +217,7 @@ async def get_runs_in_work_queue(
     if work_queue.is_paused:
         return []
 
-    # handle legacy work queues that use tag-based filters
-    if work_queue.filter is not None:
-        # ensure the filter object is fully hydrated
-        # SQLAlchemy caching logic can result in a dict type instead
-        # of the full pydantic model
-        work_queue_filter = parse_obj_as(schemas.core.QueueFilter, work_queue.filter)
-        flow_run_filter = dict(
-            tags=dict(all_=work_queue_filter.tags),
-            deployment_id=dict(any_=work_queue_filter.deployment_ids, is_null_=False),
-        )
-
-    # new work queues are entirely name-based
-    else:
-        flow_run_filter = dict(work_queue_name=dict(any_=[work_queue.name]))
+    flow_run_filter = _flow_run_filter_for_work_queue(work_queue)
 
     # if the work queue has a concurrency limit, check how many runs are currently
     # executing and compare that count to the concurrency limit
@@ -246,6 +253,120 @@ async def get_runs_in_work_queue(
     )
 
 
+async def get_runs_in_work_queues(
+    session: sa.orm.Session,
+    work_queue_ids: List[UUID],
+    scheduled_before: datetime.datetime = None,
+    limit_per_queue: int = None,
+):
+    """
+    Get runs from multiple work queues at once.
+
+    Args:
+        session: A database session.
+        work_queue_ids: The work queue ids.
+        scheduled_before: Only return runs scheduled to start before this time.
+        limit_per_queue: An optional limit for the number of runs to return from
+            each queue. As with `get_runs_in_work_queue`, the limit applies to
+            the request only and does not affect a queue's concurrency limit.
+
+    Returns:
+        Dict[UUID, List[db.FlowRun]]: runs keyed by work queue id. Work queues
+            that do not exist are omitted from the result.
+    """
+
+    runs_by_queue = {}
+    for work_queue_id in work_queue_ids:
+        try:
+            runs_by_queue[work_queue_id] = await get_runs_in_work_queue(
+                session=session,
+                work_queue_id=work_queue_id,
+                scheduled_before=scheduled_before,
+                limit=limit_per_queue,
+            )
+        except ObjectNotFoundError:
+            # deleted queues are omitted rather than failing the whole batch
+            continue
+
+    return runs_by_queue
+
+
+@inject_db
+async def read_work_queue_run_tokens(
+    session: sa.orm.Session,
+    work_queue_ids: List[UUID],
+    db: OrionDBInterface,
+    scheduled_before: datetime.datetime = None,
+):
+    """
+    Compute a cheap change token for each work queue.
+
+    The token is derived from an aggregate over the scheduled runs that the
+    queue would currently serve, the queue's own update time (which covers
+    pause state and configuration edits), and — for queues with a
+    concurrency limit — the number of runs currently occupying slots. It
+    changes whenever any input to `get_runs_in_work_queue` changes, so
+    agents can compare tokens between polls and skip the more expensive run
+    query when nothing has changed.
+
+    Args:
+        session: A database session.
+        work_queue_ids: The work queue ids.
+        scheduled_before: Only consider runs scheduled to start before this
+            time, mirroring the window used when reading runs.
+
+    Returns:
+        Dict[UUID, str]: tokens keyed by work queue id. Work queues that do
+            not exist are omitted from the result.
+    """
+
+    tokens = {}
+    for work_queue_id in work_queue_ids:
+        work_queue = await read_work_queue(session=session, work_queue_id=work_queue_id)
+        if not work_queue:
+            continue
+
+        flow_run_filter = _flow_run_filter_for_work_queue(work_queue)
+
+        query = select(
+            sa.func.count(sa.text("*")), sa.func.max(db.FlowRun.updated)
+        ).select_from(db.FlowRun)
+        query = await models.flow_runs._apply_flow_run_filters(
+            query,
+            flow_run_filter=schemas.filters.FlowRunFilter(
+                **flow_run_filter,
+                state=dict(type=dict(any_=[StateType.SCHEDULED])),
+                next_scheduled_start_time=dict(before_=scheduled_before),
+            ),
+            db=db,
+        )
+
+        count, max_updated = (await session.execute(query)).one()
+
+        # the queue's own update time covers pause/unpause and configuration
+        # edits, which change what the queue serves without touching any run
+        token = f"{count}:{max_updated}:{work_queue.updated}"
+
+        # for concurrency-limited queues the served runs also depend on how
+        # many slots are occupied, so a running flow finishing must rotate
+        # the token even though the scheduled runs are unchanged
+        if work_queue.concurrency_limit is not None:
+            running = await models.flow_runs.count_flow_runs(
+                session=session,
+                flow_run_filter=schemas.filters.FlowRunFilter(
+                    **flow_run_filter,
+                    state=dict(
+                        type=dict(any_=[StateType.PENDING, StateType.RUNNING])
+                    ),
+                ),
+            )
+            token = f"{token}:{running}"
+
+        tokens[work_queue_id] = token
+
+    return tokens
+
+
 @inject_db
 async def _ensure_work_queue_exists(
     session: sa.orm.Session, name: str, db: OrionDBInterface
@@ -397,6 +397,19 @@ PREFECT_AGENT_PREFETCH_SECONDS = Setting(
     prefetched. Defaults to `10`.""",
 )
 
+PREFECT_AGENT_RUN_CACHE_MODE = Setting(
+    str,
+    default="disabled",
+    description="""Controls the agent's prefetch cache of upcoming flow runs.
+    When set to `disabled`, every poll queries the work queues directly. When
+    set to `shadow`, the cache is maintained and compared against live query
+    results, logging any mismatches, but live results are always used. When
+    set to `enabled`, polls are served from the cache whenever it covers the
+    prefetch window; work queues with a concurrency limit are never served
+    from the cache, because cached runs would bypass the server-side
+    concurrency gate. Defaults to `disabled`.""",
+)
+
 PREFECT_ORION_DATABASE_PASSWORD = Setting(
     str,
     default=None,
@@ -1,36 +1,35 @@
 import json
+import time
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict
 from unittest import mock
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, create_autospec
 
-import anyio.abc
-import kubernetes
-import kubernetes as k8s
-import pendulum
 import pytest
 import yaml
 from jsonpatch import JsonPatch
-from kubernetes.config import ConfigException
 from pydantic import ValidationError
 
+# Skip the whole module once at import time rather than re-checking the
+# import in every fixture
+kubernetes = pytest.importorskip("kubernetes")
+k8s = kubernetes
+from kubernetes.config import ConfigException
+
 from prefect.infrastructure.kubernetes import (
     KubernetesImagePullPolicy,
     KubernetesJob,
     KubernetesManifest,
 )
 
-
-@pytest.fixture(autouse=True)
-def skip_if_kubernetes_is_not_installed():
-    pytest.importorskip("kubernetes")
+# Touch the model once at import so that no single test pays pydantic's
+# one-time model-compilation cost
+KubernetesJob(command=["warmup"]).build_job()
 
 
 @pytest.fixture
 def mock_watch(monkeypatch):
-    pytest.importorskip("kubernetes")
-
     mock = MagicMock()
 
     monkeypatch.setattr("kubernetes.watch.Watch", MagicMock(return_value=mock))
@@ -39,8 +38,6 @@ def mock_watch(monkeypatch):
 
 @pytest.fixture
 def mock_cluster_config(monkeypatch):
-    pytest.importorskip("kubernetes")
-
     mock = MagicMock()
     # We cannot mock this or the `except` clause will complain
     mock.config.ConfigException = ConfigException
@@ -50,18 +47,39 @@ def mock_cluster_config(monkeypatch):
     return mock
 
 
+# Building a mock against a spec introspects every attribute of the spec
+# class, which for the large kubernetes API classes is the dominant setup cost
+# in this module. Each spec'd mock is built once per module and reset between
+# tests by the function-scoped fixtures below.
+
+
+@pytest.fixture(scope="module")
+def _v1_job_mock() -> MagicMock:
+    return create_autospec(k8s.client.V1Job, spec_set=True, instance=True)
+
+
+@pytest.fixture(scope="module")
+def _core_v1_api_mock() -> MagicMock:
+    return create_autospec(k8s.client.CoreV1Api, spec_set=True, instance=True)
+
+
+@pytest.fixture(scope="module")
+def _batch_v1_api_mock() -> MagicMock:
+    return create_autospec(k8s.client.BatchV1Api, spec_set=True, instance=True)
+
+
 @pytest.fixture
-def mock_k8s_v1_job():
-    mock = MagicMock(spec=k8s.client.V1Job)
+def mock_k8s_v1_job(_v1_job_mock):
+    mock = _v1_job_mock
+    mock.reset_mock(return_value=True, side_effect=True)
     mock.metadata.name = "mock-k8s-v1-job"
     return mock
 
 
 @pytest.fixture
-def mock_k8s_client(monkeypatch, mock_cluster_config):
-    pytest.importorskip("kubernetes")
-
-    mock = MagicMock(spec=k8s.client.CoreV1Api)
+def mock_k8s_client(monkeypatch, mock_cluster_config, _core_v1_api_mock):
+    mock = _core_v1_api_mock
+    mock.reset_mock(return_value=True, side_effect=True)
 
     @contextmanager
     def get_client(_):
@@ -75,10 +93,11 @@ def mock_k8s_client(monkeypatch, mock_cluster_config):
 
 
 @pytest.fixture
-def mock_k8s_batch_client(monkeypatch, mock_cluster_config, mock_k8s_v1_job):
-    pytest.importorskip("kubernetes")
-
-    mock = MagicMock(spec=k8s.client.BatchV1Api)
+def mock_k8s_batch_client(
+    monkeypatch, mock_cluster_config, mock_k8s_v1_job, _batch_v1_api_mock
+):
+    mock = _batch_v1_api_mock
+    mock.reset_mock(return_value=True, side_effect=True)
     mock.read_namespaced_job.return_value = mock_k8s_v1_job
     mock.create_namespaced_job.return_value = mock_k8s_v1_job
 
@@ -93,20 +112,49 @@ def mock_k8s_batch_client(monkeypatch, mock_cluster_config, mock_k8s_v1_job):
     return mock
 
 
+# Built once at import: spec introspection on the kubernetes API classes is
+# expensive and these stand-ins are never asserted against.
+_job_pod = MagicMock(spec=kubernetes.client.V1Pod)
+_job_pod.status.phase = "Running"
+
+_completed_job = MagicMock(spec=kubernetes.client.V1Job)
+
+
 def _mock_pods_stream_that_returns_running_pod(*args, **kwargs):
-    job_pod = MagicMock(spec=kubernetes.client.V1Pod)
-    job_pod.status.phase = "Running"
+    _completed_job.status.completion_time = time.time()
+    return [{"object": _job_pod}, {"object": _completed_job}]
+
+
+def _created_manifest(mock_k8s_batch_client) -> Dict:
+    """The manifest passed to the last create_namespaced_job call"""
+    return mock_k8s_batch_client.create_namespaced_job.call_args.args[1]
 
-    job = MagicMock(spec=kubernetes.client.V1Job)
-    job.status.completion_time = pendulum.now("utc").timestamp()
 
-    return [{"object": job_pod}, {"object": job}]
+class _RecordingTaskStatus:
+    """A minimal anyio.abc.TaskStatus stand-in; much cheaper than a spec'd
+    MagicMock against the kubernetes-heavy call path"""
+
+    def __init__(self):
+        self.started_calls = []
+
+    def started(self, value=None):
+        self.started_calls.append(value)
 
 
 def test_infrastructure_type():
     assert KubernetesJob().type == "kubernetes-job"
 
 
+@pytest.fixture(scope="module")
+def default_echo_job() -> KubernetesJob:
+    """
+    The job most tests run, constructed and validated once per module; tests
+    that need a variation derive one with `.copy(update=...)` instead of
+    paying for a fresh construction.
+    """
+    return KubernetesJob(command=["echo", "hello"])
+
+
 def test_building_a_job_is_idempotent():
     """Building a Job twice from should return different copies
     of the Job manifest with identical values"""
@@ -121,13 +169,13 @@ async def test_creates_job_by_building_a_manifest(
     mock_k8s_batch_client,
     mock_k8s_client,
     mock_watch,
+    default_echo_job,
 ):
     mock_watch.stream = _mock_pods_stream_that_returns_running_pod
 
-    fake_status = MagicMock(spec=anyio.abc.TaskStatus)
-    k8s_job = KubernetesJob(command=["echo", "hello"])
-    expected_manifest = k8s_job.build_job()
-    await k8s_job.run(fake_status)
+    fake_status = _RecordingTaskStatus()
+    expected_manifest = default_echo_job.build_job()
+    await default_echo_job.run(fake_status)
     mock_k8s_client.read_namespaced_pod_status.assert_called_once()
 
     mock_k8s_batch_client.create_namespaced_job.assert_called_with(
@@ -135,17 +183,18 @@ async def test_creates_job_by_building_a_manifest(
         expected_manifest,
     )
 
-    fake_status.started.assert_called_once()
+    assert len(fake_status.started_calls) == 1
 
 
 async def test_task_status_receives_job_name(
     mock_k8s_batch_client,
     mock_k8s_client,
     mock_watch,
+    default_echo_job,
 ):
-    fake_status = MagicMock(spec=anyio.abc.TaskStatus)
-    result = await KubernetesJob(command=["echo", "hello"]).run(task_status=fake_status)
-    fake_status.started.assert_called_once_with(result.identifier)
+    fake_status = _RecordingTaskStatus()
+    result = await default_echo_job.run(task_status=fake_status)
+    assert fake_status.started_calls == [result.identifier]
 
 
 @pytest.mark.parametrize(
@@ -160,54 +209,92 @@ async def test_task_status_receives_job_name(
         ("infra9.-foo_bar^x", "infra9-foo-bar-x"),
     ],
 )
-async def test_job_name_creates_valid_name(
-    mock_k8s_client,
-    mock_watch,
-    mock_k8s_batch_client,
-    job_name,
-    clean_name,
-):
-    mock_watch.stream = _mock_pods_stream_that_returns_running_pod
-    fake_status = MagicMock(spec=anyio.abc.TaskStatus)
-    await KubernetesJob(name=job_name, command=["echo", "hello"]).run(fake_status)
-    mock_k8s_batch_client.create_namespaced_job.assert_called_once()
-    call_name = mock_k8s_batch_client.create_namespaced_job.call_args[0][1]["metadata"][
-        "generateName"
-    ]
-    assert call_name == clean_name
+def test_job_name_creates_valid_name(job_name, clean_name, default_echo_job):
+    assert default_echo_job._slugify_name(job_name) == clean_name
 
 
-async def test_uses_image_setting(
-    mock_k8s_client,
-    mock_watch,
-    mock_k8s_batch_client,
-):
-    mock_watch.stream = _mock_pods_stream_that_returns_running_pod
-
-    await KubernetesJob(command=["echo", "hello"], image="foo").run(MagicMock())
-    mock_k8s_batch_client.create_namespaced_job.assert_called_once()
-    image = mock_k8s_batch_client.create_namespaced_job.call_args[0][1]["spec"][
-        "template"
-    ]["spec"]["containers"][0]["image"]
-    assert image == "foo"
+def test_job_name_reaches_the_manifest(default_echo_job):
+    manifest = default_echo_job.copy(update={"name": "infra*run"}).build_job()
+    assert manifest["metadata"]["generateName"] == "infra-run"
 
 
-async def test_uses_labels_setting(
+@pytest.mark.parametrize(
+    "update,path,expected",
+    [
+        pytest.param(
+            {"image": "foo"},
+            "spec.template.spec.containers.0.image",
+            "foo",
+            id="image",
+        ),
+        pytest.param(
+            {"labels": {"foo": "foo", "bar": "bar"}},
+            "metadata.labels.foo",
+            "foo",
+            id="first-label",
+        ),
+        pytest.param(
+            {"labels": {"foo": "foo", "bar": "bar"}},
+            "metadata.labels.bar",
+            "bar",
+            id="second-label",
+        ),
+        pytest.param(
+            {"namespace": "foo"},
+            "metadata.namespace",
+            "foo",
+            id="namespace",
+        ),
+        pytest.param(
+            {"service_account_name": "foo"},
+            "spec.template.spec.serviceAccountName",
+            "foo",
+            id="service-account-name",
+        ),
+        pytest.param(
+            {},
+            "spec.template.spec.containers.0.imagePullPolicy",
+            None,
+            id="unspecified-image-pull-policy",
+        ),
+        pytest.param(
+            {"image_pull_policy": KubernetesImagePullPolicy.IF_NOT_PRESENT},
+            "spec.template.spec.containers.0.imagePullPolicy",
+            "IfNotPresent",
+            id="specified-image-pull-policy",
+        ),
+        pytest.param(
+            {},
+            "spec.template.spec.imagePullPolicy",
+            None,
+            id="unspecified-restart-policy",
+        ),
+    ],
+)
+async def test_manifest_reflects_job_settings(
     mock_k8s_client,
     mock_watch,
     mock_k8s_batch_client,
+    default_echo_job,
+    update,
+    path,
+    expected,
 ):
     mock_watch.stream = _mock_pods_stream_that_returns_running_pod
 
-    await KubernetesJob(
-        command=["echo", "hello"], labels={"foo": "foo", "bar": "bar"}
-    ).run(MagicMock())
+    await default_echo_job.copy(update=update).run(MagicMock())
     mock_k8s_batch_client.create_namespaced_job.assert_called_once()
-    labels = mock_k8s_batch_client.create_namespaced_job.call_args[0][1]["metadata"][
-        "labels"
-    ]
-    assert labels["foo"] == "foo"
-    assert labels["bar"] == "bar"
+    manifest = _created_manifest(mock_k8s_batch_client)
+
+    value = manifest
+    for key in path.split("."):
+        if isinstance(value, list):
+            value = value[int(key)]
+        else:
+            value = value.get(key)
+            if value is None:
+                break
+    assert value == expected
 
 
 @pytest.mark.parametrize(
@@ -236,25 +323,8 @@ async def test_uses_labels_setting(
         ("$@*^$@/name", "$@*^$@/name"),
     ],
 )
-async def test_sanitizes_user_label_keys(
-    mock_k8s_client,
-    mock_watch,
-    mock_k8s_batch_client,
-    given,
-    expected,
-):
-    mock_watch.stream = _mock_pods_stream_that_returns_running_pod
-
-    await KubernetesJob(command=["echo", "hello"], labels={given: "foo"}).run(
-        MagicMock()
-    )
-    mock_k8s_batch_client.create_namespaced_job.assert_called_once()
-    labels = mock_k8s_batch_client.create_namespaced_job.call_args[0][1]["metadata"][
-        "labels"
-    ]
-    assert len(list(labels.keys())) == 1, "Only a single label should be created"
-    assert list(labels.keys())[0] == expected
-    assert labels[expected] == "foo"
+def test_sanitizes_user_label_keys(given, expected, default_echo_job):
+    assert default_echo_job._slugify_label_key(given) == expected
 
 
 @pytest.mark.parametrize(
@@ -271,103 +341,15 @@ async def test_sanitizes_user_label_keys(
         ("$@*^$@", "$@*^$@"),
     ],
 )
-async def test_sanitizes_user_label_values(
-    mock_k8s_client,
-    mock_watch,
-    mock_k8s_batch_client,
-    given,
-    expected,
-):
-    mock_watch.stream = _mock_pods_stream_that_returns_running_pod
-
-    await KubernetesJob(command=["echo", "hello"], labels={"foo": given}).run(
-        MagicMock()
-    )
-    mock_k8s_batch_client.create_namespaced_job.assert_called_once()
-    labels = mock_k8s_batch_client.create_namespaced_job.call_args[0][1]["metadata"][
-        "labels"
-    ]
-    assert labels["foo"] == expected
-
-
-async def test_uses_namespace_setting(
-    mock_k8s_client,
-    mock_watch,
-    mock_k8s_batch_client,
-):
-    mock_watch.stream = _mock_pods_stream_that_returns_running_pod
-
-    await KubernetesJob(command=["echo", "hello"], namespace="foo").run(MagicMock())
-    mock_k8s_batch_client.create_namespaced_job.assert_called_once()
-    namespace = mock_k8s_batch_client.create_namespaced_job.call_args[0][1]["metadata"][
-        "namespace"
-    ]
-    assert namespace == "foo"
-
-
-async def test_uses_service_account_name_setting(
-    mock_k8s_client,
-    mock_watch,
-    mock_k8s_batch_client,
-):
-    mock_watch.stream = _mock_pods_stream_that_returns_running_pod
-
-    await KubernetesJob(command=["echo", "hello"], service_account_name="foo").run(
-        MagicMock()
-    )
-    mock_k8s_batch_client.create_namespaced_job.assert_called_once()
-    service_account_name = mock_k8s_batch_client.create_namespaced_job.call_args[0][1][
-        "spec"
-    ]["template"]["spec"]["serviceAccountName"]
-    assert service_account_name == "foo"
+def test_sanitizes_user_label_values(given, expected, default_echo_job):
+    assert default_echo_job._slugify_label_value(given) == expected
 
 
-async def test_defaults_to_unspecified_image_pull_policy(
-    mock_k8s_client,
-    mock_watch,
-    mock_k8s_batch_client,
-):
-    mock_watch.stream = _mock_pods_stream_that_returns_running_pod
-
-    await KubernetesJob(command=["echo", "hello"]).run(MagicMock())
-    mock_k8s_batch_client.create_namespaced_job.assert_called_once()
-    call_image_pull_policy = mock_k8s_batch_client.create_namespaced_job.call_args[0][
-        1
-    ]["spec"]["template"]["spec"]["containers"][0].get("imagePullPolicy")
-    assert call_image_pull_policy is None
-
-
-async def test_uses_specified_image_pull_policy(
-    mock_k8s_client,
-    mock_watch,
-    mock_k8s_batch_client,
-):
-    mock_watch.stream = _mock_pods_stream_that_returns_running_pod
-
-    await KubernetesJob(
-        command=["echo", "hello"],
-        image_pull_policy=KubernetesImagePullPolicy.IF_NOT_PRESENT,
-    ).run(MagicMock())
-    mock_k8s_batch_client.create_namespaced_job.assert_called_once()
-    call_image_pull_policy = mock_k8s_batch_client.create_namespaced_job.call_args[0][
-        1
-    ]["spec"]["template"]["spec"]["containers"][0].get("imagePullPolicy")
-    assert call_image_pull_policy == "IfNotPresent"
-
-
-async def test_defaults_to_unspecified_restart_policy(
-    mock_k8s_client,
-    mock_watch,
-    mock_k8s_batch_client,
-):
-    mock_watch.stream = _mock_pods_stream_that_returns_running_pod
-
-    await KubernetesJob(command=["echo", "hello"]).run(MagicMock())
-    mock_k8s_batch_client.create_namespaced_job.assert_called_once()
-    call_restart_policy = mock_k8s_batch_client.create_namespaced_job.call_args[0][1][
-        "spec"
-    ]["template"]["spec"].get("imagePullPolicy")
-    assert call_restart_policy is None
+def test_sanitized_labels_reach_the_manifest(default_echo_job):
+    manifest = default_echo_job.copy(
+        update={"labels": {"infra*run": "has-an-invalid$@-value"}}
+    ).build_job()
+    assert manifest["metadata"]["labels"] == {"infra-run": "has-an-invalid-value"}
 
 
 async def test_no_raise_on_submission_with_hosted_api(
@@ -375,8 +357,9 @@ async def test_no_raise_on_submission_with_hosted_api(
     mock_k8s_batch_client,
     mock_k8s_client,
     use_hosted_orion,
+    default_echo_job,
 ):
-    await KubernetesJob(command=["echo", "hello"]).run(MagicMock())
+    await default_echo_job.run(MagicMock())
 
 
 async def test_defaults_to_incluster_config(
@@ -384,11 +367,12 @@ async def test_defaults_to_incluster_config(
     mock_watch,
     mock_cluster_config,
     mock_k8s_batch_client,
+    default_echo_job,
 ):
     mock_watch.stream = _mock_pods_stream_that_returns_running_pod
-    fake_status = MagicMock(spec=anyio.abc.TaskStatus)
+    fake_status = _RecordingTaskStatus()
 
-    await KubernetesJob(command=["echo", "hello"]).run(fake_status)
+    await default_echo_job.run(fake_status)
 
     mock_cluster_config.load_incluster_config.assert_called_once()
     assert not mock_cluster_config.load_kube_config.called
@@ -399,13 +383,14 @@ async def test_uses_cluster_config_if_not_in_cluster(
     mock_watch,
     mock_cluster_config,
     mock_k8s_batch_client,
+    default_echo_job,
 ):
     mock_watch.stream = _mock_pods_stream_that_returns_running_pod
-    fake_status = MagicMock(spec=anyio.abc.TaskStatus)
+    fake_status = _RecordingTaskStatus()
 
     mock_cluster_config.load_incluster_config.side_effect = ConfigException()
 
-    await KubernetesJob(command=["echo", "hello"]).run(fake_status)
+    await default_echo_job.run(fake_status)
 
     mock_cluster_config.load_kube_config.assert_called_once()
 
@@ -414,15 +399,14 @@ async def test_allows_configurable_timeouts_for_pod_and_job_watches(
     mock_k8s_client,
     mock_watch,
     mock_k8s_batch_client,
+    default_echo_job,
 ):
     mock_watch.stream = mock.Mock(
         side_effect=_mock_pods_stream_that_returns_running_pod
     )
 
-    await KubernetesJob(
-        command=["echo", "hello"],
-        pod_watch_timeout_seconds=42,
-        job_watch_timeout_seconds=24,
+    await default_echo_job.copy(
+        update={"pod_watch_timeout_seconds": 42, "job_watch_timeout_seconds": 24}
     ).run(MagicMock())
 
     mock_watch.stream.assert_has_calls(
@@ -447,12 +431,13 @@ async def test_watches_the_right_namespace(
     mock_k8s_client,
     mock_watch,
     mock_k8s_batch_client,
+    default_echo_job,
 ):
     mock_watch.stream = mock.Mock(
         side_effect=_mock_pods_stream_that_returns_running_pod
     )
 
-    await KubernetesJob(command=["echo", "hello"], namespace="my-awesome-flows").run(
+    await default_echo_job.copy(update={"namespace": "my-awesome-flows"}).run(
         MagicMock()
     )
 
@@ -477,58 +462,35 @@ async def test_watches_the_right_namespace(
 class TestCustomizingBaseJob:
     """Tests scenarios where a user is providing a customized base Job template"""
 
-    def test_validates_against_an_empty_job(self):
-        """We should give a human-friendly error when the user provides an empty custom
-        Job manifest"""
-        with pytest.raises(ValidationError) as excinfo:
-            KubernetesJob(job={})
-
-        assert excinfo.value.errors() == [
-            {
-                "loc": ("job",),
-                "msg": (
+    @pytest.mark.parametrize(
+        "job,expected_msg",
+        [
+            pytest.param(
+                {},
+                (
                     "Job is missing required attributes at the following paths: "
                     "/apiVersion, /kind, /metadata, /spec"
                 ),
-                "type": "value_error",
-            }
-        ]
-
-    def test_validates_for_a_job_missing_deeper_attributes(self):
-        """We should give a human-friendly error when the user provides an incomplete
-        custom Job manifest"""
-        with pytest.raises(ValidationError) as excinfo:
-            KubernetesJob(
-                command=["echo", "hello"],
-                job={
+                id="empty-job",
+            ),
+            pytest.param(
+                {
                     "apiVersion": "batch/v1",
                     "kind": "Job",
                     "metadata": {},
                     "spec": {"template": {"spec": {}}},
                 },
-            )
-
-        assert excinfo.value.errors() == [
-            {
-                "loc": ("job",),
-                "msg": (
+                (
                     "Job is missing required attributes at the following paths: "
                     "/metadata/labels, /spec/template/spec/completions, "
                     "/spec/template/spec/containers, "
                     "/spec/template/spec/parallelism, "
                     "/spec/template/spec/restartPolicy"
                 ),
-                "type": "value_error",
-            }
-        ]
-
-    def test_validates_for_a_job_with_incompatible_values(self):
-        """We should give a human-friendly error when the user provides a custom Job
-        manifest that is attempting to change required values."""
-        with pytest.raises(ValidationError) as excinfo:
-            KubernetesJob(
-                command=["echo", "hello"],
-                job={
+                id="missing-deeper-attributes",
+            ),
+            pytest.param(
+                {
                     "apiVersion": "v1",
                     "kind": "JobbledyJunk",
                     "metadata": {"labels": {}},
@@ -548,16 +510,25 @@ class TestCustomizingBaseJob:
                         }
                     },
                 },
-            )
-
-        assert excinfo.value.errors() == [
-            {
-                "loc": ("job",),
-                "msg": (
+                (
                     "Job has incompatble values for the following attributes: "
                     "/apiVersion must have value 'batch/v1', "
                     "/kind must have value 'Job'"
                 ),
+                id="incompatible-values",
+            ),
+        ],
+    )
+    def test_validates_user_supplied_job(self, job, expected_msg):
+        """We should give a human-friendly error when the user provides an
+        empty, incomplete, or incompatible custom Job manifest"""
+        with pytest.raises(ValidationError) as excinfo:
+            KubernetesJob(command=["echo", "hello"], job=job)
+
+        assert excinfo.value.errors() == [
+            {
+                "loc": ("job",),
+                "msg": expected_msg,
                 "type": "value_error",
             }
         ]
@@ -792,40 +763,66 @@ class TestCustomizingJob:
         ]
 
 
-class TestLoadingManifestsFromFiles:
-    @pytest.fixture
-    def example(self) -> KubernetesManifest:
-        return {
-            "apiVersion": "batch/v1",
-            "kind": "Job",
-            "metadata": {"labels": {"my-custom-label": "sweet"}},
+_EXAMPLE_MANIFEST: KubernetesManifest = {
+    "apiVersion": "batch/v1",
+    "kind": "Job",
+    "metadata": {"labels": {"my-custom-label": "sweet"}},
+    "spec": {
+        "template": {
             "spec": {
-                "template": {
-                    "spec": {
-                        "containers": [
-                            {
-                                "name": "prefect-job",
-                                "env": [],
-                            }
-                        ]
+                "containers": [
+                    {
+                        "name": "prefect-job",
+                        "env": [],
                     }
-                }
-            },
+                ]
+            }
         }
+    },
+}
+
+_EXAMPLE_PATCH = JsonPatch(
+    [
+        {
+            "op": "add",
+            "path": "/spec/template/spec/containers/0/env/-",
+            "value": {
+                "name": "MY_API_TOKEN",
+                "valueFrom": {
+                    "secretKeyRef": {
+                        "name": "the-secret-name",
+                        "key": "api-token",
+                    }
+                },
+            },
+        },
+        {
+            "op": "add",
+            "path": "/spec/template/spec/resources",
+            "value": {"limits": {"memory": "8Gi", "cpu": "4000m"}},
+        },
+    ]
+)
 
-    @pytest.fixture
-    def example_yaml(self, tmp_path: Path, example: KubernetesManifest) -> Path:
-        filename = tmp_path / "example.yaml"
+
+class TestLoadingManifestsFromFiles:
+    @pytest.fixture(scope="module")
+    def example(self) -> KubernetesManifest:
+        return _EXAMPLE_MANIFEST
+
+    @pytest.fixture(scope="module")
+    def example_yaml(self, tmp_path_factory, example: KubernetesManifest) -> Path:
+        filename = tmp_path_factory.mktemp("manifests") / "example.yaml"
         with open(filename, "w") as f:
-            yaml.dump(example, f)
+            yaml.dump(example, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
         yield filename
 
     def test_job_from_yaml(self, example: KubernetesManifest, example_yaml: Path):
         assert KubernetesJob.job_from_file(example_yaml) == example
 
-    @pytest.fixture
-    def example_json(self, tmp_path: Path, example: KubernetesManifest) -> Path:
-        filename = tmp_path / "example.json"
+    @pytest.fixture(scope="module")
+    def example_json(self, tmp_path_factory, example: KubernetesManifest) -> Path:
+        filename = tmp_path_factory.mktemp("manifests") / "example.json"
         with open(filename, "w") as f:
             json.dump(example, f)
         yield filename
@@ -848,47 +845,29 @@ class TestLoadingPatchesFromFiles:
         assert list(patch_1) == list(patch_2)
         assert list(patch_1) != list(patch_3)
 
-        assert patch_1.apply({}) == patch_2.apply({})
-        assert patch_1.apply({}) != patch_3.apply({})
+        applied_1 = patch_1.apply({})
+        assert applied_1 == patch_2.apply({})
+        assert applied_1 != patch_3.apply({})
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def example(self) -> JsonPatch:
-        return JsonPatch(
-            [
-                {
-                    "op": "add",
-                    "path": "/spec/template/spec/containers/0/env/-",
-                    "value": {
-                        "name": "MY_API_TOKEN",
-                        "valueFrom": {
-                            "secretKeyRef": {
-                                "name": "the-secret-name",
-                                "key": "api-token",
-                            }
-                        },
-                    },
-                },
-                {
-                    "op": "add",
-                    "path": "/spec/template/spec/resources",
-                    "value": {"limits": {"memory": "8Gi", "cpu": "4000m"}},
-                },
-            ]
-        )
+        return _EXAMPLE_PATCH
 
-    @pytest.fixture
-    def example_yaml(self, tmp_path: Path, example: JsonPatch) -> Path:
-        filename = tmp_path / "example.yaml"
+    @pytest.fixture(scope="module")
+    def example_yaml(self, tmp_path_factory, example: JsonPatch) -> Path:
+        filename = tmp_path_factory.mktemp("patches") / "example.yaml"
         with open(filename, "w") as f:
-            yaml.dump(list(example), f)
+            yaml.dump(
+                list(example), f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            )
         yield filename
 
     def test_patch_from_yaml(self, example: KubernetesManifest, example_yaml: Path):
         assert KubernetesJob.customize_from_file(example_yaml) == example
 
-    @pytest.fixture
-    def example_json(self, tmp_path: Path, example: JsonPatch) -> Path:
-        filename = tmp_path / "example.json"
+    @pytest.fixture(scope="module")
+    def example_json(self, tmp_path_factory, example: JsonPatch) -> Path:
+        filename = tmp_path_factory.mktemp("patches") / "example.json"
         with open(filename, "w") as f:
             json.dump(list(example), f)
         yield filename
@@ -620,6 +620,62 @@ class TestSetFlowRunState:
         assert response2.json()["status"] == "ACCEPT"
 
 
+class TestSetFlowRunStates:
+    async def test_set_flow_run_states(self, flow, client, session):
+        flow_runs = [
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=core.FlowRun(flow_id=flow.id),
+            )
+            for _ in range(3)
+        ]
+        await session.commit()
+
+        response = await client.post(
+            "/flow_runs/set_states",
+            json=dict(
+                states={
+                    str(flow_run.id): dict(type="RUNNING", name="Test State")
+                    for flow_run in flow_runs
+                }
+            ),
+        )
+        assert response.status_code == 200
+
+        results = response.json()
+        assert set(results.keys()) == {str(flow_run.id) for flow_run in flow_runs}
+        for result in results.values():
+            api_response = OrchestrationResult.parse_obj(result)
+            assert api_response.status == responses.SetStateStatus.ACCEPT
+
+        flow_run_ids = [flow_run.id for flow_run in flow_runs]
+        for flow_run in flow_runs:
+            session.expire(flow_run)
+
+        for flow_run_id in flow_run_ids:
+            run = await models.flow_runs.read_flow_run(
+                session=session, flow_run_id=flow_run_id
+            )
+            assert run.state.type == states.StateType.RUNNING
+            assert run.state.name == "Test State"
+
+    async def test_set_flow_run_states_omits_nonexistent_runs(
+        self, flow_run, client
+    ):
+        missing_id = uuid4()
+        response = await client.post(
+            "/flow_runs/set_states",
+            json=dict(
+                states={
+                    str(flow_run.id): dict(type="RUNNING"),
+                    str(missing_id): dict(type="RUNNING"),
+                }
+            ),
+        )
+        assert response.status_code == 200
+        assert set(response.json().keys()) == {str(flow_run.id)}
+
+
 class TestFlowRunHistory:
     async def test_history_interval_must_be_one_second_or_larger(self, client):
         response = await client.post(
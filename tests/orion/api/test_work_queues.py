@@ -1,5 +1,5 @@
-from typing import List
-from uuid import uuid4
+from typing import Dict, List
+from uuid import UUID, uuid4
 
 import pendulum
 import pydantic
@@ -348,6 +348,139 @@ class TestGetRunsInWorkQueue:
         assert agent.last_activity_time >= now
 
 
+class TestGetRunsInWorkQueues:
+    @pytest.fixture
+    async def work_queue_2(self, session):
+        work_queue = await models.work_queues.create_work_queue(
+            session=session,
+            work_queue=schemas.core.WorkQueue(name="wq-2"),
+        )
+        await session.commit()
+        return work_queue
+
+    @pytest.fixture
+    async def scheduled_flow_runs(self, session, deployment, work_queue, work_queue_2):
+        for i in range(3):
+            for wq in [work_queue, work_queue_2]:
+                await models.flow_runs.create_flow_run(
+                    session=session,
+                    flow_run=schemas.core.FlowRun(
+                        flow_id=deployment.flow_id,
+                        deployment_id=deployment.id,
+                        work_queue_name=wq.name,
+                        state=schemas.states.State(
+                            type="SCHEDULED",
+                            timestamp=pendulum.now("UTC").add(minutes=i),
+                            state_details=dict(
+                                scheduled_time=pendulum.now("UTC").add(minutes=i)
+                            ),
+                        ),
+                    ),
+                )
+        await session.commit()
+
+    async def test_get_runs_in_queues(
+        self, client, work_queue, work_queue_2, scheduled_flow_runs
+    ):
+        response = await client.post(
+            "/work_queues/get_runs",
+            json=dict(work_queue_ids=[str(work_queue.id), str(work_queue_2.id)]),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        runs_by_queue = pydantic.parse_obj_as(
+            Dict[UUID, List[schemas.core.FlowRun]], response.json()
+        )
+        assert set(runs_by_queue.keys()) == {work_queue.id, work_queue_2.id}
+        assert len(runs_by_queue[work_queue.id]) == 3
+        assert len(runs_by_queue[work_queue_2.id]) == 3
+        assert all(
+            r.work_queue_name == work_queue.name for r in runs_by_queue[work_queue.id]
+        )
+
+    async def test_get_runs_in_queues_applies_limit_per_queue(
+        self, client, work_queue, work_queue_2, scheduled_flow_runs
+    ):
+        response = await client.post(
+            "/work_queues/get_runs",
+            json=dict(
+                work_queue_ids=[str(work_queue.id), str(work_queue_2.id)], limit=2
+            ),
+        )
+        runs_by_queue = response.json()
+        assert len(runs_by_queue[str(work_queue.id)]) == 2
+        assert len(runs_by_queue[str(work_queue_2.id)]) == 2
+
+    async def test_get_runs_in_queues_omits_nonexistant_queues(
+        self, client, work_queue, scheduled_flow_runs
+    ):
+        missing_id = uuid4()
+        response = await client.post(
+            "/work_queues/get_runs",
+            json=dict(work_queue_ids=[str(work_queue.id), str(missing_id)]),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        runs_by_queue = response.json()
+        assert str(work_queue.id) in runs_by_queue
+        assert str(missing_id) not in runs_by_queue
+
+
+class TestReadWorkQueueRunTokens:
+    async def test_token_changes_when_a_run_is_scheduled(
+        self, client, work_queue, deployment, session
+    ):
+        response = await client.post(
+            "/work_queues/tokens",
+            json=dict(work_queue_ids=[str(work_queue.id)]),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        token = response.json()[str(work_queue.id)]
+
+        await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=deployment.flow_id,
+                deployment_id=deployment.id,
+                work_queue_name=work_queue.name,
+                state=schemas.states.State(
+                    type="SCHEDULED",
+                    timestamp=pendulum.now("UTC"),
+                    state_details=dict(scheduled_time=pendulum.now("UTC")),
+                ),
+            ),
+        )
+        await session.commit()
+
+        response = await client.post(
+            "/work_queues/tokens",
+            json=dict(work_queue_ids=[str(work_queue.id)]),
+        )
+        assert response.json()[str(work_queue.id)] != token
+
+    async def test_token_is_stable_when_nothing_changes(self, client, work_queue):
+        response1 = await client.post(
+            "/work_queues/tokens",
+            json=dict(work_queue_ids=[str(work_queue.id)]),
+        )
+        response2 = await client.post(
+            "/work_queues/tokens",
+            json=dict(work_queue_ids=[str(work_queue.id)]),
+        )
+        assert (
+            response1.json()[str(work_queue.id)]
+            == response2.json()[str(work_queue.id)]
+        )
+
+    async def test_omits_nonexistant_queues(self, client, work_queue):
+        missing_id = uuid4()
+        response = await client.post(
+            "/work_queues/tokens",
+            json=dict(work_queue_ids=[str(work_queue.id), str(missing_id)]),
+        )
+        assert str(work_queue.id) in response.json()
+        assert str(missing_id) not in response.json()
+
+
 class TestDeleteWorkQueue:
     async def test_delete_work_queue(self, client, work_queue):
         response = await client.delete(f"/work_queues/{work_queue.id}")
@@ -1,16 +1,42 @@
-from uuid import uuid4
+from datetime import datetime, timezone
+from uuid import UUID
 
-import pendulum
+import pytest
 import sqlalchemy as sa
 
-from prefect.orion import schemas
-from prefect.orion.schemas.filters import LogFilter
+from prefect.orion.schemas.filters import LogFilter, PrefectFilterBaseModel
 
-NOW = pendulum.now()
+NOW = datetime.now(timezone.utc)
+FLOW_RUN_ID = UUID("00000000-0000-4000-8000-000000000001")
+TASK_RUN_ID = UUID("00000000-0000-4000-8000-000000000002")
+
+# Evaluated once at import so collection does not rebuild the case table
+SINGLE_CONDITION_CASES = (
+    pytest.param(
+        {"level": {"le_": 10}},
+        lambda db: db.Log.level <= 10,
+        id="level-le",
+    ),
+    pytest.param(
+        {"level": {"ge_": 10}},
+        lambda db: db.Log.level >= 10,
+        id="level-ge",
+    ),
+    pytest.param(
+        {"timestamp": {"before_": NOW}},
+        lambda db: db.Log.timestamp <= NOW,
+        id="timestamp-before",
+    ),
+    pytest.param(
+        {"timestamp": {"after_": NOW}},
+        lambda db: db.Log.timestamp >= NOW,
+        id="timestamp-after",
+    ),
+)
 
 
 async def test_filters_without_params_do_not_error():
-    class MyFilter(schemas.filters.PrefectFilterBaseModel):
+    class MyFilter(PrefectFilterBaseModel):
         def _get_filter_list(self, db):
             return []
 
@@ -19,42 +45,25 @@ async def test_filters_without_params_do_not_error():
 
 
 class TestLogFilters:
-    def test_applies_level_le_filter(self, db):
-        log_filter = LogFilter(level={"le_": 10})
-        sql_filter = log_filter.as_sql_filter(db)
-        assert sql_filter.compare(sa.and_(db.Log.level <= 10))
-
-    def test_applies_level_ge_filter(self, db):
-        log_filter = LogFilter(level={"ge_": 10})
-        sql_filter = log_filter.as_sql_filter(db)
-        assert sql_filter.compare(sa.and_(db.Log.level >= 10))
-
-    def test_applies_timestamp_filter_before(self, db):
-        log_filter = LogFilter(timestamp={"before_": NOW})
-        sql_filter = log_filter.as_sql_filter(db)
-        assert sql_filter.compare(sa.and_(db.Log.timestamp <= NOW))
-
-    def test_applies_timestamp_filter_after(self, db):
-        log_filter = LogFilter(timestamp={"after_": NOW})
+    @pytest.mark.parametrize("filter_kwargs,expected", SINGLE_CONDITION_CASES)
+    def test_applies_single_condition(self, db, filter_kwargs, expected):
+        log_filter = LogFilter(**filter_kwargs)
         sql_filter = log_filter.as_sql_filter(db)
-        assert sql_filter.compare(sa.and_(db.Log.timestamp >= NOW))
+        assert sql_filter.compare(sa.and_(expected(db)))
 
     def test_applies_flow_run_id_filter(self, db):
-        flow_run_id = uuid4()
-        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+        log_filter = LogFilter(flow_run_id={"any_": [FLOW_RUN_ID]})
         sql_filter = log_filter.as_sql_filter(db)
-        assert sql_filter.compare(sa.and_(db.Log.flow_run_id.in_([flow_run_id])))
+        assert sql_filter.compare(sa.and_(db.Log.flow_run_id.in_([FLOW_RUN_ID])))
 
     def test_applies_task_run_id_filter(self, db):
-        task_run_id = uuid4()
-        log_filter = LogFilter(task_run_id={"any_": [task_run_id]})
+        log_filter = LogFilter(task_run_id={"any_": [TASK_RUN_ID]})
         sql_filter = log_filter.as_sql_filter(db)
-        assert sql_filter.compare(sa.and_(db.Log.task_run_id.in_([task_run_id])))
+        assert sql_filter.compare(sa.and_(db.Log.task_run_id.in_([TASK_RUN_ID])))
 
     def test_applies_multiple_conditions(self, db):
-        task_run_id = uuid4()
-        log_filter = LogFilter(task_run_id={"any_": [task_run_id]}, level={"ge_": 20})
+        log_filter = LogFilter(task_run_id={"any_": [TASK_RUN_ID]}, level={"ge_": 20})
         sql_filter = log_filter.as_sql_filter(db)
         assert sql_filter.compare(
-            sa.and_(db.Log.task_run_id.in_([task_run_id]), db.Log.level >= 20)
+            sa.and_(db.Log.task_run_id.in_([TASK_RUN_ID]), db.Log.level >= 20)
         )
@@ -1,14 +1,16 @@
+import asyncio
 from unittest.mock import ANY, MagicMock
 
 import pendulum
 import pytest
 
 from prefect import flow
-from prefect.agent import OrionAgent
+from prefect.agent import OrionAgent, _WorkQueueCacheEntry
 from prefect.blocks.core import Block
 from prefect.exceptions import Abort
 from prefect.orion import models, schemas
 from prefect.orion.schemas.states import Completed, Pending, Running, Scheduled
+from prefect.settings import PREFECT_AGENT_RUN_CACHE_MODE, temporary_settings
 from prefect.testing.utilities import AsyncMock
 
 
@@ -41,8 +43,8 @@ async def test_agent_start_and_shutdown():
         assert agent.started
         assert agent.task_group is not None
         assert agent.client is not None
-        agent.submitting_flow_run_ids.add("test")
-    assert agent.submitting_flow_run_ids == set(), "Resets submitting flow run ids"
+        agent.submitting_flow_run_ids["test"] = None
+    assert agent.submitting_flow_run_ids == {}, "Resets submitting flow run ids"
     assert agent.task_group is None, "Shuts down the task group"
     assert agent.client is None, "Shuts down the client"
 
@@ -160,7 +162,117 @@ async def test_agent_caches_work_queues(orion_client, deployment, monkeypatch):
         # the mock was not awaited again
         mock.assert_awaited_once()
 
-        assert agent._work_queue_cache[0].id == work_queue.id
+        assert agent._work_queue_cache[work_queue.name].work_queue.id == work_queue.id
+
+
+async def test_agent_refreshes_work_queues_before_they_expire(
+    orion_client, deployment, monkeypatch
+):
+    work_queue = await orion_client.read_work_queue_by_name(deployment.work_queue_name)
+
+    async def read_queue(name):
+        return work_queue
+
+    mock = AsyncMock(side_effect=read_queue)
+    monkeypatch.setattr("prefect.client.OrionClient.read_work_queue_by_name", mock)
+
+    async with OrionAgent(work_queues=[work_queue.name], prefetch_seconds=10) as agent:
+        await agent.get_and_submit_flow_runs()
+        mock.assert_awaited_once()
+
+        # a fresh entry is not refreshed
+        await agent._refresh_work_queues()
+        mock.assert_awaited_once()
+
+        # an entry about to expire is re-read and its expiration is extended
+        expiring_soon = pendulum.now("UTC").add(seconds=1)
+        agent._work_queue_cache[work_queue.name] = _WorkQueueCacheEntry(
+            work_queue=work_queue,
+            expires_at=expiring_soon,
+            last_hit=pendulum.now("UTC"),
+        )
+        await agent._refresh_work_queues()
+        assert mock.await_count == 2
+        assert agent._work_queue_cache[work_queue.name].expires_at > expiring_soon
+
+
+async def test_agent_coalesces_concurrent_work_queue_refreshes(
+    orion_client, deployment, monkeypatch
+):
+    work_queue = await orion_client.read_work_queue_by_name(deployment.work_queue_name)
+
+    async def read_queue(name):
+        await asyncio.sleep(0.1)
+        return work_queue
+
+    mock = AsyncMock(side_effect=read_queue)
+    monkeypatch.setattr("prefect.client.OrionClient.read_work_queue_by_name", mock)
+
+    async with OrionAgent(work_queues=[work_queue.name], prefetch_seconds=10) as agent:
+        await asyncio.gather(
+            agent._refresh_work_queues(), agent._refresh_work_queues()
+        )
+
+        # both refreshes coalesced into a single read
+        mock.assert_awaited_once()
+
+
+async def test_agent_skips_work_queues_with_unchanged_tokens(
+    orion_client, deployment, monkeypatch
+):
+    work_queue = await orion_client.read_work_queue_by_name(deployment.work_queue_name)
+
+    mock = AsyncMock(return_value={work_queue.id: []})
+    monkeypatch.setattr("prefect.client.OrionClient.get_runs_in_work_queues", mock)
+
+    async with OrionAgent(work_queues=[work_queue.name], prefetch_seconds=10) as agent:
+
+        await agent.get_and_submit_flow_runs()
+        mock.assert_awaited_once()
+
+        # the token has not changed so the queue is not polled again
+        await agent.get_and_submit_flow_runs()
+        mock.assert_awaited_once()
+
+        # scheduling a new run rotates the token and triggers another poll
+        await orion_client.create_flow_run_from_deployment(
+            deployment.id,
+            state=Scheduled(scheduled_time=pendulum.now("utc")),
+        )
+        await agent.get_and_submit_flow_runs()
+        assert mock.await_count == 2
+
+
+async def test_agent_serves_runs_from_cache_when_enabled(orion_client, deployment):
+    flow_run = await orion_client.create_flow_run_from_deployment(
+        deployment.id,
+        state=Scheduled(scheduled_time=pendulum.now("utc")),
+    )
+
+    with temporary_settings({PREFECT_AGENT_RUN_CACHE_MODE: "enabled"}):
+        async with OrionAgent(
+            work_queues=[deployment.work_queue_name], prefetch_seconds=10
+        ) as agent:
+            agent.submit_run = AsyncMock()  # do not actually run anything
+
+            # the background loop also refreshes the cache; expire the work
+            # queue cache and refresh explicitly so the test does not depend
+            # on the loop's timing
+            agent._work_queue_cache.clear()
+            await agent._refresh_run_cache()
+
+            # replace the batch read to prove polls are served from memory
+            mock = AsyncMock(return_value={})
+            agent.client.get_runs_in_work_queues = mock
+
+            submitted_flow_runs = await agent.get_and_submit_flow_runs()
+            assert {run.id for run in submitted_flow_runs} == {flow_run.id}
+            mock.assert_not_awaited()
+
+            # served runs are consumed and not returned again before a refresh
+            submitted_flow_runs = await agent.get_and_submit_flow_runs()
+            assert submitted_flow_runs == []
+            mock.assert_not_awaited()
 
 
 async def test_agent_with_work_queue_name_survives_queue_deletion(
@@ -193,7 +305,7 @@ async def test_agent_internal_submit_run_called(orion_client, deployment):
         agent.submit_run = AsyncMock()
         await agent.get_and_submit_flow_runs()
 
-    agent.submit_run.assert_awaited_once_with(flow_run)
+    agent.submit_run.assert_awaited_once_with(flow_run, ANY)
 
 
 async def test_agent_runs_multiple_work_queues(orion_client, session, flow):
@@ -240,6 +352,56 @@ async def test_agent_runs_multiple_work_queues(orion_client, session, flow):
     }
 
 
+async def test_agent_caches_infrastructure_documents(orion_client, deployment):
+    flow_run = await orion_client.create_flow_run_from_deployment(
+        deployment.id,
+        state=Scheduled(scheduled_time=pendulum.now("utc")),
+    )
+
+    async with OrionAgent(
+        work_queues=[deployment.work_queue_name], prefetch_seconds=10
+    ) as agent:
+        infrastructure = await agent.get_infrastructure(flow_run)
+
+        # a warm cache serves the block document without another read
+        mock = AsyncMock()
+        agent.client.read_block_document = mock
+        assert await agent.get_infrastructure(flow_run) == infrastructure
+        mock.assert_not_awaited()
+
+
+async def test_agent_applies_infra_overrides(
+    orion_client, session, flow, infrastructure_document_id, storage_document_id
+):
+    deployment = await models.deployments.create_deployment(
+        session=session,
+        deployment=schemas.core.Deployment(
+            name="overridden-deployment",
+            flow_id=flow.id,
+            infrastructure_document_id=infrastructure_document_id,
+            storage_document_id=storage_document_id,
+            infra_overrides={"env.MY_TEST_VARIABLE": 2, "stream_output": False},
+            work_queue_name="wq",
+        ),
+    )
+    await session.commit()
+
+    flow_run = await orion_client.create_flow_run_from_deployment(
+        deployment.id,
+        state=Scheduled(scheduled_time=pendulum.now("utc")),
+    )
+
+    async with OrionAgent(
+        work_queues=[deployment.work_queue_name], prefetch_seconds=10
+    ) as agent:
+        infrastructure = await agent.get_infrastructure(flow_run)
+
+    # override values are coerced by the block's field types, so the int
+    # supplied for the `Dict[str, str]` env field arrives as a string
+    assert infrastructure.env["MY_TEST_VARIABLE"] == "2"
+    assert infrastructure.stream_output is False
+
+
 class TestInfrastructureIntegration:
     @pytest.fixture
     def mock_submit(self, monkeypatch):
@@ -314,7 +476,7 @@ class TestInfrastructureIntegration:
         async with OrionAgent(
             work_queues=[deployment.work_queue_name], prefetch_seconds=10
         ) as agent:
-            agent.submitting_flow_run_ids.add(flow_run.id)
+            agent.submitting_flow_run_ids[flow_run.id] = flow_run
             await agent.submit_run(flow_run)
 
         sleep.assert_awaited_once_with(10)
@@ -335,10 +497,12 @@ class TestInfrastructureIntegration:
         async with OrionAgent(
             work_queues=[deployment.work_queue_name], prefetch_seconds=10
         ) as agent:
-            agent.submitting_flow_run_ids.add(flow_run.id)
+            agent.submitting_flow_run_ids[flow_run.id] = flow_run
             agent.logger = MagicMock()
 
-            agent.client.propose_state = AsyncMock(return_value=return_state)
+            agent.client.propose_states = AsyncMock(
+                return_value={flow_run.id: return_state}
+            )
             await agent.submit_run(flow_run)
 
         mock_submit.assert_not_called()
@@ -361,7 +525,7 @@ class TestInfrastructureIntegration:
         async with OrionAgent(
             work_queues=[deployment.work_queue_name], prefetch_seconds=10
         ) as agent:
-            agent.submitting_flow_run_ids.add(flow_run.id)
+            agent.submitting_flow_run_ids[flow_run.id] = flow_run
             agent.logger = MagicMock()
 
             await agent.submit_run(flow_run)
@@ -384,9 +548,11 @@ class TestInfrastructureIntegration:
         async with OrionAgent(
             work_queues=[deployment.work_queue_name], prefetch_seconds=10
         ) as agent:
-            agent.submitting_flow_run_ids.add(flow_run.id)
+            agent.submitting_flow_run_ids[flow_run.id] = flow_run
             agent.logger = MagicMock()
-            agent.client.propose_state = AsyncMock(side_effect=Abort("message"))
+            agent.client.propose_states = AsyncMock(
+                return_value={flow_run.id: Abort("message")}
+            )
 
             await agent.submit_run(flow_run)
 
@@ -479,7 +645,7 @@ async def test_agent_displays_message_on_work_queue_pause(
         await orion_client.update_work_queue(work_queue.id, is_paused=True)
 
         # clear agent cache
-        agent._work_queue_cache_expiration = pendulum.now()
+        agent._work_queue_cache.clear()
 
         # Should emit the paused message
         await agent.get_and_submit_flow_runs()
@@ -845,6 +845,32 @@ async def test_read_flows_with_filter(orion_client):
     assert {flow.id for flow in flows} == {flow_id_1, flow_id_2}
 
 
+async def test_iter_flows_pages_through_results(orion_client):
+    flow_ids = set()
+    for i in range(5):
+
+        @flow(name=f"flow-{i}")
+        def foo():
+            pass
+
+        flow_ids.add(await orion_client.create_flow(foo))
+
+    # a page size smaller than the result set forces multiple reads
+    flows = [
+        flow_
+        async for flow_ in orion_client.iter_flows(page_size=2)
+    ]
+    assert all(isinstance(flow_, schemas.core.Flow) for flow_ in flows)
+    assert {flow_.id for flow_ in flows} == flow_ids
+
+    # the limit caps the number of flows yielded
+    limited = [
+        flow_
+        async for flow_ in orion_client.iter_flows(limit=3, page_size=2)
+    ]
+    assert len(limited) == 3
+
+
 async def test_read_flow_by_name(orion_client):
     @flow(name="null-flow")
     def do_nothing():